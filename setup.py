@@ -51,6 +51,7 @@ setup(
     extras_require={
         "docs": ["sphinx<7", "sphinx-rtd-theme", "sphinx-autodoc-typehints"],
         "intel": ["scikit-learn-intelex"],
+        "isal": ["isal"],
         "dev": ["memory-profiler"],
     },
     entry_points={"console_scripts": ["snpio=run_snpio.py:main"]},
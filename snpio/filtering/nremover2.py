@@ -1123,6 +1123,28 @@ class NRemover2:
         else:
             return filtered_alignment_array, mask_indices
 
+    @staticmethod
+    def _msa_to_array(msa):
+        """
+        Converts a MultipleSeqAlignment to a 2D array of single characters.
+
+        The sequences are joined as bytes and split into characters in one pass instead of building a Python list per sequence.
+
+        Args:
+            msa (MultipleSeqAlignment): The alignment to convert.
+
+        Returns:
+            numpy.ndarray: Array of shape (n_samples, n_loci) with dtype "<U1".
+        """
+        if len(msa) == 0:
+            return np.array([])
+        seqs = b"".join(bytes(record.seq) for record in msa)
+        return (
+            np.frombuffer(seqs, dtype="S1")
+            .reshape(len(msa), -1)
+            .astype("U1")
+        )
+
     @staticmethod
     def resolve_ambiguity(base):
         """
@@ -1615,7 +1637,7 @@ class NRemover2:
             None.
         """
         if isinstance(self._alignment, MultipleSeqAlignment):
-            a = np.array([list(str(record.seq)) for record in self._alignment])
+            a = self._msa_to_array(self._alignment)
         else:
             a = np.array(self._alignment)
         return a
@@ -1635,9 +1657,7 @@ class NRemover2:
             None.
         """
         if isinstance(value, MultipleSeqAlignment):
-            self._alignment = np.array(
-                [list(str(record.seq)) for record in value]
-            )
+            self._alignment = self._msa_to_array(value)
         else:
             self._alignment = value
 
@@ -1,16 +1,27 @@
 import copy
-import gzip
+import mmap
 import os
 import random
 import re
 import sys
+import tempfile
 import textwrap
 import warnings
 from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
 from scipy.stats import hmean
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 warnings.simplefilter(action="ignore", category=FutureWarning)
 
@@ -31,6 +42,13 @@ import toytree as tt
 
 from snpio.utils import misc
 
+try:
+    # python-isal is an optional drop-in replacement for gzip with much
+    # faster (de)compression.
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+
 import pysam
 from Bio.Align import MultipleSeqAlignment
 from Bio.Seq import Seq
@@ -39,7 +57,6 @@ from pysam import VariantFile
 
 from snpio.plotting.plotting import Plotting as Plotting
 from snpio.read_input.popmap_file import ReadPopmap
-from snpio.utils import sequence_tools
 from snpio.utils.custom_exceptions import UnsupportedFileTypeError
 from snpio.utils.misc import (
     class_performance_decorator,
@@ -54,6 +71,33 @@ from snpio.utils.misc import (
 resource_data = {}
 
 
+@dataclass
+class VCFAttributes:
+    """Per-locus VCF fields assembled when writing a VCF file.
+
+    Each field holds one value per locus, except ``info``, which maps INFO field names to per-locus arrays, and ``calldata``, which holds the per-locus sample columns as tab-delimited strings.
+    """
+
+    chrom: Optional[np.ndarray] = None
+    pos: Optional[np.ndarray] = None
+    id: Optional[np.ndarray] = None
+    ref: Optional[np.ndarray] = None
+    alt: Optional[np.ndarray] = None
+    qual: Optional[np.ndarray] = None
+    filter: Optional[np.ndarray] = None
+    info: Optional[Dict[str, np.ndarray]] = None
+    format: Optional[np.ndarray] = None
+    calldata: Optional[np.ndarray] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the VCF fields as a dictionary keyed by field name.
+
+        Returns:
+            Dict[str, Any]: VCF field names as keys and field values as values.
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
 @class_performance_decorator(measure=False)
 class GenotypeData:
     """A class for handling and analyzing genotype data.
@@ -234,6 +278,145 @@ class GenotypeData:
     """
 
     resource_data = {}
+    _profiling_enabled = False
+
+    # Row/column index of each nucleotide in _IUPAC_PAIR_LUT. Any other
+    # allele (e.g., N, indels, or '*') maps to the last row/column.
+    _BASE_INDEX = {"A": 0, "C": 1, "G": 2, "T": 3}
+
+    # IUPAC code for each unordered pair of alleles (A, C, G, T, other).
+    _IUPAC_PAIR_LUT = np.array(
+        [
+            ["A", "M", "R", "W", "A"],
+            ["M", "C", "S", "Y", "C"],
+            ["R", "S", "G", "K", "G"],
+            ["W", "Y", "K", "T", "T"],
+            ["A", "C", "G", "T", "N"],
+        ],
+        dtype="<U1",
+    )
+
+    # STRUCTURE genotype for each IUPAC code. Any other code is missing.
+    _IUPAC_GENOTYPES: ClassVar[Dict[str, str]] = {
+        "A": "0/0",
+        "T": "1/1",
+        "C": "2/2",
+        "G": "3/3",
+        "W": "0/1",
+        "M": "0/2",
+        "R": "0/3",
+        "Y": "1/2",
+        "K": "1/3",
+        "S": "2/3",
+        "N": "-9/-9",
+    }
+
+    _GENOTYPE_IUPAC: ClassVar[Dict[str, str]] = {
+        v: k for k, v in _IUPAC_GENOTYPES.items()
+    }
+
+    # IUPAC code for each nucleotide genotype, used to decode 012 data.
+    _DIPLOID_IUPAC: ClassVar[Dict[str, str]] = {
+        "A/A": "A",
+        "T/T": "T",
+        "G/G": "G",
+        "C/C": "C",
+        "A/G": "R",
+        "G/A": "R",
+        "C/T": "Y",
+        "T/C": "Y",
+        "G/C": "S",
+        "C/G": "S",
+        "A/T": "W",
+        "T/A": "W",
+        "G/T": "K",
+        "T/G": "K",
+        "A/C": "M",
+        "C/A": "M",
+        "N/N": "N",
+    }
+
+    # Index of each allele value in STRUCTURE files. Any other value maps to
+    # the last index and is treated as missing.
+    _STRUCTURE_ALLELE_INDEX: ClassVar[Dict[str, int]] = {
+        "-9": 0,
+        "0": 1,
+        "1": 2,
+        "2": 3,
+        "3": 4,
+    }
+
+    # First and second STRUCTURE allele for each IUPAC code, indexed by the
+    # byte value of the code so the uint8 snp_data can be looked up directly.
+    _STRUCTURE_ALLELE_LUT = np.full((256, 2), "-9", dtype="<U2")
+
+    # IUPAC byte code for each (first, second) pair of STRUCTURE allele
+    # indices. Pairs not in _IUPAC_GENOTYPES map to 'N'.
+    _STRUCTURE_PAIR_LUT = np.full((6, 6), ord("N"), dtype=np.uint8)
+
+    for _code, _genotype in _IUPAC_GENOTYPES.items():
+        _first, _second = _genotype.split("/")
+        _STRUCTURE_ALLELE_LUT[ord(_code)] = _first, _second
+        _STRUCTURE_PAIR_LUT[
+            _STRUCTURE_ALLELE_INDEX[_first], _STRUCTURE_ALLELE_INDEX[_second]
+        ] = ord(_code)
+    del _code, _genotype, _first, _second
+
+    # Both alleles of each IUPAC code, indexed by the byte value of the code.
+    # Missing and unrecognized codes map to ("N", "N").
+    _IUPAC_ALLELE_LUT = np.full((256, 2), "N", dtype="<U1")
+    for _code, _alleles in {
+        "M": "AC",
+        "R": "AG",
+        "W": "AT",
+        "S": "CG",
+        "Y": "CT",
+        "K": "GT",
+        "A": "AA",
+        "T": "TT",
+        "G": "GG",
+        "C": "CC",
+    }.items():
+        _IUPAC_ALLELE_LUT[ord(_code)] = list(_alleles)
+    del _code, _alleles
+
+    # True for each IUPAC byte code that is treated as missing data.
+    _IUPAC_MISSING = np.all(_IUPAC_ALLELE_LUT == "N", axis=1)
+
+    # Reader method for each supported filetype, dispatched by _read_aln.
+    _READERS: ClassVar[Dict[str, str]] = {
+        "phylip": "read_phylip",
+        "structure": "read_structure",
+        "012": "read_012",
+        "vcf": "read_vcf",
+    }
+
+    # Memory layout of the encoded genotype matrices (012 and integer).
+    # Column-major so that per-locus reductions walk contiguous memory.
+    # The uint8 _snp_data matrix itself stays row-major (one contiguous row
+    # per sample): the per-locus kernels operate on whole columns at once,
+    # and the PHYLIP/STRUCTURE writers and subsetting are sample-major.
+    _layout = "F"
+
+    # Constructor arguments reported by the ``inputs`` property.
+    _PARAM_NAMES = (
+        "filename",
+        "filetype",
+        "popmapfile",
+        "force_popmap",
+        "exclude_pops",
+        "include_pops",
+        "guidetree",
+        "qmatrix_iqtree",
+        "qmatrix",
+        "siterates",
+        "siterates_iqtree",
+        "plot_format",
+        "prefix",
+        "verbose",
+        "loci_indices",
+        "sample_indices",
+    )
 
     def __init__(
         self,
@@ -273,25 +456,11 @@ class GenotypeData:
         self.chunk_size = chunk_size
         self.verbose = verbose
         self.measure = kwargs.get("measure", False)
+        self.threads = kwargs.get("threads", 1)
+        if self.measure:
+            self.enable_profiling()
         self.supported_filetypes = ["vcf", "phylip", "structure", "auto"]
 
-        self._kwargs = {
-            "filename": filename,
-            "filetype": filetype,
-            "popmapfile": popmapfile,
-            "force_popmap": force_popmap,
-            "exclude_pops": exclude_pops,
-            "include_pops": include_pops,
-            "guidetree": guidetree,
-            "qmatrix_iqtree": qmatrix_iqtree,
-            "qmatrix": qmatrix,
-            "siterates": siterates,
-            "siterates_iqtree": siterates_iqtree,
-            "plot_format": plot_format,
-            "prefix": prefix,
-            "verbose": verbose,
-        }
-
         if "vcf_attributes" in kwargs:
             self._vcf_attributes = kwargs["vcf_attributes"]
         else:
@@ -305,6 +474,10 @@ class GenotypeData:
         self._q = None
         self._site_rates = None
         self._tree = None
+        self._cache_012 = None
+        self._cache_snpsdict = None
+        self._cache_site_rates = None
+        self._fmt012 = None
         self._popmap = None
         self._popmap_inverse = None
         self.vcf_header = None
@@ -358,10 +531,6 @@ class GenotypeData:
                 print("Found the following populations:\nPopulation\tCount\n")
             self._my_popmap.get_pop_counts(plot_dir_prefix=self.prefix)
 
-        self._kwargs["filetype"] = self.filetype
-        self._kwargs["loci_indices"] = self.loci_indices
-        self._kwargs["sample_indices"] = self.sample_indices
-
         vcf_attr_path = os.path.join(
             f"{self.prefix}_output",
             "gtdata",
@@ -396,37 +565,42 @@ class GenotypeData:
             OSError: If no filetype is specified.
             OSError: If an unsupported filetype is provided.
         """
-        try:
-            with open(filename, "r") as fin:
-                lines = fin.readlines()
-        except UnicodeDecodeError:
-            with gzip.open(filename, "rt") as fin:
-                lines = fin.readlines()
+        with open(filename, "rb") as fin:
+            magic = fin.read(256)
 
-        lines = [line.strip() for line in lines]
+        is_gzipped = magic.startswith(b"\x1f\x8b")
+        if is_gzipped:
+            with gzip.open(filename, "rb") as fin:
+                magic = fin.read(256)
 
-        # Check for VCF format
-        if (
-            any(line.startswith("##fileformat=VCF") for line in lines)
-            or any(line.startswith("#CHROM") for line in lines)
-            or any(line.startswith("##FORMAT") for line in lines)
-            or any(line.startswith("##INFO") for line in lines)
-        ):
+        # Check for VCF format. The VCF specification requires the
+        # '##fileformat' line to be first, so only the head is needed.
+        if magic.startswith((b"##fileformat=VCF", b"#CHROM")):
             return "vcf"
 
-        # Check for PHYLIP format
+        opener = gzip.open if is_gzipped else open
+
+        # Check for PHYLIP format. Only the header and first sequence are
+        # parsed; the sample count is checked against a raw newline count.
+        with opener(filename, "rb") as fin:
+            header = fin.readline().split()
+            first = fin.readline().split()
+
         try:
-            if len(list(map(int, lines[0].split()))) == 2:
-                num_samples, num_loci = map(int, lines[0].split())
+            if len(header) == 2 and len(first) >= 2:
+                num_samples, num_loci = map(int, header)
 
-                if num_samples == len(lines[1:]):
-                    line = lines[1]
-                    seqs = line.split()[1]
-                    if num_loci == len(list(seqs)):
+                if num_loci == len(first[1]):
+                    if num_samples == self._count_lines(filename) - 1:
                         return "phylip"
         except ValueError:
             pass
 
+        with opener(filename, "rt") as fin:
+            lines = fin.readlines()
+
+        lines = [line.strip() for line in lines]
+
         # Check for STRUCTURE or encoded 012 format
         lines = lines[1:]
 
@@ -462,6 +636,91 @@ class GenotypeData:
             return "012"
         return False
 
+    @staticmethod
+    def _count_lines(filename: str) -> int:
+        """Count the lines in a plain or gzipped file, ignoring trailing blank lines.
+
+        Newlines are counted directly on the (memory-mapped) raw bytes, so the file is never split into Python strings.
+
+        Args:
+            filename (str): Path to the input file.
+
+        Returns:
+            int: Number of lines up to the last non-whitespace character.
+        """
+        with open(filename, "rb") as fin:
+            is_gzipped = fin.read(2) == b"\x1f\x8b"
+
+        if is_gzipped:
+            with gzip.open(filename, "rb") as fin:
+                buf = fin.read()
+            return GenotypeData._count_buffer_lines(buf)
+
+        with open(filename, "rb") as fin:
+            try:
+                with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return GenotypeData._count_buffer_lines(mm)
+            except ValueError:
+                # mmap cannot map an empty file.
+                return 0
+
+    @staticmethod
+    def _count_buffer_lines(buf) -> int:
+        """Count the lines in a bytes-like buffer, ignoring trailing blank lines.
+
+        Args:
+            buf (bytes or mmap.mmap): Raw file contents.
+
+        Returns:
+            int: Number of lines up to the last non-whitespace character.
+        """
+        arr = np.frombuffer(buf, dtype=np.uint8)
+        n_newlines = int(np.count_nonzero(arr == 0x0A))
+
+        # Discount newlines that only terminate trailing whitespace.
+        i = arr.size - 1
+        while i >= 0 and arr[i] in (0x0A, 0x0D, 0x20, 0x09):
+            if arr[i] == 0x0A:
+                n_newlines -= 1
+            i -= 1
+        del arr  # Release the buffer export before an mmap is closed.
+
+        return n_newlines + 1 if i >= 0 else 0
+
+    @staticmethod
+    def _read_lines(filename: str) -> List[bytes]:
+        """Read the non-blank lines of a file as stripped bytes.
+
+        The file is memory-mapped and the newline offsets are found with a single NumPy scan, so only the per-line slicing happens in Python.
+
+        Args:
+            filename (str): Path to the input file.
+
+        Returns:
+            List[bytes]: Non-blank lines with surrounding whitespace removed.
+        """
+        with open(filename, "rb") as fin:
+            try:
+                mm = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # mmap cannot map an empty file.
+                return []
+
+        with mm:
+            arr = np.frombuffer(mm, dtype=np.uint8)
+            ends = np.flatnonzero(arr == 0x0A).tolist()
+            del arr  # Release the buffer export before the mmap is closed.
+
+            starts = [0] + [end + 1 for end in ends]
+            ends.append(len(mm))
+
+            lines = []
+            for start, end in zip(starts, ends):
+                line = mm[start:end].strip()
+                if line:
+                    lines.append(line)
+        return lines
+
     def _read_aln(
         self, filetype: Optional[str] = None, popmapfile: Optional[str] = None
     ) -> None:
@@ -478,26 +737,17 @@ class GenotypeData:
         """
         if filetype is None:
             raise OSError("No filetype specified.\n")
+
+        ft = filetype.lower()
+        reader = self._READERS.get(ft)
+        if reader is None:
+            raise OSError(f"Unsupported filetype provided: {filetype}\n")
+
+        self.filetype = ft
+        if ft == "structure":
+            getattr(self, reader)(popids=popmapfile is None)
         else:
-            if filetype.lower() == "phylip":
-                self.filetype = filetype
-                self.read_phylip()
-            elif filetype.lower() == "structure":
-                self.filetype = "structure"
-                has_popids = True if popmapfile is None else False
-                self.read_structure(popids=has_popids)
-            elif filetype == "012":
-                self.filetype = filetype
-                self.read_012()
-            elif filetype == "vcf":
-                self.filetype = filetype
-                self.read_vcf()
-            elif filetype is None:
-                raise TypeError(
-                    "filetype argument must be provided, but got NoneType."
-                )
-            else:
-                raise OSError(f"Unsupported filetype provided: {filetype}\n")
+            getattr(self, reader)()
 
     def _check_filetype(self, filetype: str) -> None:
         """
@@ -566,23 +816,24 @@ class GenotypeData:
         if not os.path.isfile(fname):
             raise FileNotFoundError(f"File {fname} not found!")
 
+        strip, split = str.strip, str.split
         with open(fname, "r") as fin:
             header = True
             qlines = list()
-            for line in fin:
-                line = line.strip()
+            append = qlines.append
+            for raw in fin:
+                line = strip(raw)
                 if not line:
                     continue
                 if header:
                     if label:
-                        order = line.split()
+                        order = split(line)
                         header = False
                     else:
                         order = ["A", "C", "G", "T"]
                     continue
                 else:
-                    qlines.append(line.split())
-        fin.close()
+                    append(split(line))
 
         for l in qlines:
             for index in range(0, 4):
@@ -610,24 +861,24 @@ class GenotypeData:
         q = self._blank_q_matrix()
         qlines = list()
         try:
-            with open(iqfile, "r") as fin:
-                foundLine = False
-                matlinecount = 0
-                for line in fin:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    if "Rate matrix Q" in line:
-                        foundLine = True
-                        continue
-                    if foundLine:
-                        matlinecount += 1
-                        if matlinecount > 4:
-                            break
-                        stuff = line.split()
-                        qlines.append(stuff)
-                    else:
-                        continue
+            with open(iqfile, "rb") as fin:
+                with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Jump straight to the Q-matrix section instead of
+                    # scanning the whole file line by line.
+                    start = mm.find(b"Rate matrix Q")
+                    if start >= 0:
+                        mm.seek(start)
+                        mm.readline()  # Skip the "Rate matrix Q:" line.
+                        while len(qlines) < 4:
+                            line = mm.readline()
+                            if not line:
+                                break
+                            line = line.strip()
+                            if line:
+                                qlines.append(line.decode().split())
+        except ValueError:
+            # mmap cannot map an empty file.
+            pass
         except (IOError, FileNotFoundError):
             raise FileNotFoundError(f"Could not open IQ-TREE file {iqfile}")
 
@@ -681,19 +932,19 @@ class GenotypeData:
             IOError: If the rates file could not be read from.
         """
         s = []
+        strip, split, append = str.strip, str.split, s.append
         try:
             with open(iqfile, "r") as fin:
-                for line in fin:
-                    line = line.strip()
+                for raw in fin:
+                    line = strip(raw)
                     if (
                         not line
-                        or line.startswith("#")
-                        or line.lower().startswith("site")
+                        or line[0] == "#"
+                        or line[:4].lower() == "site"
                     ):
                         continue
                     else:
-                        stuff = line.split()
-                        s.append(float(stuff[1]))
+                        append(float(split(line)[1]))
 
         except (IOError, FileNotFoundError):
             raise IOError(f"Could not open iqtree file {iqfile}")
@@ -722,37 +973,113 @@ class GenotypeData:
             List[float]: List of site-specific substitution rates.
         """
         s = list()
+        strip, split, append = str.strip, str.split, s.append
         with open(fname, "r") as fin:
-            for line in fin:
-                line = line.strip()
+            for raw in fin:
+                line = strip(raw)
                 if not line:
                     continue
                 else:
-                    s.append(float(line.split()[0]))
-        fin.close()
+                    append(float(split(line)[0]))
         return s
 
-    def _validate_seq_lengths(self) -> None:
+    def _validate_seq_lengths(self, snp_data=None) -> None:
         """Validate that all sequences have the same length.
 
+        Args:
+            snp_data (numpy.ndarray or List[List[str]], optional): Genotypes to validate. If None, validates ``self._snp_data``. Defaults to None.
+
         Raises:
             ValueError: If not all sequences (rows) are the same length.
         """
+        if snp_data is None:
+            snp_data = self._snp_data
+
         # Make sure all sequences are the same length.
-        all_same = all(len(row) == self.num_snps for row in self._snp_data)
+        lengths = np.array([len(row) for row in snp_data])
 
-        if not all_same:
-            bad_rows = [
-                i
-                for i, row in enumerate(self.num_snps)
-                if len(row) != self.num_snps
-            ]
+        if lengths.size and np.any(lengths != lengths[0]):
+            bad_rows = np.flatnonzero(lengths != np.bincount(lengths).argmax())
 
-            bad_sampleids = [self._samples[i] for i in bad_rows]
+            bad_sampleids = [str(self._samples[i]) for i in bad_rows]
             raise ValueError(
                 f"The following sequences in the alignment were of unequal lengths: {','.join(bad_sampleids)}"
             )
 
+    @staticmethod
+    def _as_codes(snp_data) -> np.ndarray:
+        """Convert genotypes to a 2D uint8 array of ASCII IUPAC codes.
+
+        This is the internal storage format of ``snp_data``: one byte per genotype instead of one Python string object.
+
+        Args:
+            snp_data (numpy.ndarray, pandas.DataFrame, MultipleSeqAlignment, or List[List[str]]): IUPAC genotypes of shape (n_samples, n_loci). uint8 arrays are returned unchanged.
+
+        Returns:
+            numpy.ndarray: uint8 array of shape (n_samples, n_loci).
+        """
+        if isinstance(snp_data, np.ndarray) and snp_data.dtype == np.uint8:
+            return snp_data
+        if isinstance(snp_data, pd.DataFrame):
+            snp_data = snp_data.to_numpy()
+        elif isinstance(snp_data, MultipleSeqAlignment):
+            # Join the aligned sequences and view them as one byte matrix.
+            seqs = bytearray(
+                b"".join(str(rec.seq).encode("ascii") for rec in snp_data)
+            )
+            return np.frombuffer(seqs, dtype=np.uint8).reshape(
+                len(snp_data), -1
+            )
+        return np.ascontiguousarray(snp_data, dtype="S1").view(np.uint8)
+
+    @property
+    def _snp_chars(self) -> np.ndarray:
+        """Genotypes as a 2D array of single-character strings (dtype '<U1')."""
+        return self._snp_data.view("S1").astype("U1")
+
+    @classmethod
+    def _structure_to_codes(
+        cls, first: List[str], second: Optional[List[str]] = None
+    ) -> np.ndarray:
+        """Convert the alleles of one STRUCTURE sample to IUPAC codes.
+
+        Each distinct allele value is looked up once, and the allele pairs at all loci are then converted with a single table lookup.
+
+        Args:
+            first (List[str]): Alleles on the first line. In one-row format, both alleles of each locus are given consecutively.
+
+            second (List[str], optional): Alleles on the second line in two-row format. Defaults to None.
+
+        Returns:
+            numpy.ndarray: uint8 array of IUPAC codes, one per locus.
+
+        Raises:
+            ValueError: If the first and second lines have differing lengths.
+
+            ValueError: If the line has a non-even number of alleles.
+        """
+        if second is None:
+            if len(first) % 2 != 0:
+                raise ValueError("Line has non-even number of alleles!\n")
+            alleles = first
+        elif len(first) != len(second):
+            raise ValueError(
+                "First and second lines have different number of alleles\n"
+            )
+        else:
+            alleles = first + second
+
+        values, inverse = np.unique(alleles, return_inverse=True)
+        allele_index = cls._STRUCTURE_ALLELE_INDEX
+        missing = len(allele_index)
+        idx = np.array(
+            [allele_index.get(v, missing) for v in values], dtype=np.intp
+        )[inverse]
+
+        if second is None:
+            return cls._STRUCTURE_PAIR_LUT[idx[0::2], idx[1::2]]
+        return cls._STRUCTURE_PAIR_LUT[idx[: len(first)], idx[len(first) :]]
+
     def read_structure(self, popids: bool = True) -> None:
         """
         Read a structure file and automatically detect its format.
@@ -773,73 +1100,65 @@ class GenotypeData:
         # Detect the format of the structure file
         onerow = self.detect_format()
 
-        snp_data = list()
-        with open(self.filename, "r") as fin:
-            if not onerow:
-                firstline = None
-                for line in fin:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    if not firstline:
-                        firstline = line.split()
-                        continue
-                    else:
-                        secondline = line.split()
-                        if firstline[0] != secondline[0]:
-                            raise ValueError(
-                                f"Two rows per individual was "
-                                f"specified but sample names do not match: "
-                                f"{firstline[0]} and {secondline[0]}\n"
-                            )
+        lines = [line.decode() for line in self._read_lines(self.filename)]
 
-                        ind = firstline[0]
-                        pop = None
-                        if popids:
-                            if firstline[1] != secondline[1]:
-                                raise ValueError(
-                                    f"Two rows per individual was "
-                                    f"specified but population IDs do not "
-                                    f"match {firstline[1]} {secondline[1]}\n"
-                                )
-                            pop = firstline[1]
-                            self._populations.append(pop)
-                            firstline = firstline[2:]
-                            secondline = secondline[2:]
-                        else:
-                            firstline = firstline[1:]
-                            secondline = secondline[1:]
-                        self._samples.append(ind)
-                        genotypes = merge_alleles(firstline, secondline)
-                        snp_data.append(genotypes)
-                        firstline = None
-            else:  # If onerow:
-                for line in fin:
-                    line = line.strip()
-                    if not line:
-                        continue
+        snp_data = list()
+        if not onerow:
+            firstline = None
+            for line in lines:
+                if not firstline:
                     firstline = line.split()
+                    continue
+                else:
+                    secondline = line.split()
+                    if firstline[0] != secondline[0]:
+                        raise ValueError(
+                            f"Two rows per individual was "
+                            f"specified but sample names do not match: "
+                            f"{firstline[0]} and {secondline[0]}\n"
+                        )
+
                     ind = firstline[0]
                     pop = None
                     if popids:
+                        if firstline[1] != secondline[1]:
+                            raise ValueError(
+                                f"Two rows per individual was "
+                                f"specified but population IDs do not "
+                                f"match {firstline[1]} {secondline[1]}\n"
+                            )
                         pop = firstline[1]
                         self._populations.append(pop)
                         firstline = firstline[2:]
+                        secondline = secondline[2:]
                     else:
                         firstline = firstline[1:]
+                        secondline = secondline[1:]
                     self._samples.append(ind)
-                    genotypes = merge_alleles(firstline, second=None)
-                    snp_data.append(genotypes)
+                    snp_data.append(
+                        self._structure_to_codes(firstline, secondline)
+                    )
                     firstline = None
+        else:  # If onerow:
+            for line in lines:
+                firstline = line.split()
+                ind = firstline[0]
+                pop = None
+                if popids:
+                    pop = firstline[1]
+                    self._populations.append(pop)
+                    firstline = firstline[2:]
+                else:
+                    firstline = firstline[1:]
+                self._samples.append(ind)
+                snp_data.append(self._structure_to_codes(firstline))
+                firstline = None
 
-        snp_data = [
-            list(map(self._genotype_to_iupac, row)) for row in snp_data
-        ]
-        self._snp_data = snp_data
-        self._validate_seq_lengths()
+        self._validate_seq_lengths(snp_data)
+        self._snp_data = np.array(snp_data, dtype=np.uint8)
 
         self._ref, self._alt, self._alt2 = self._get_ref_alt_alleles(
-            self._snp_data
+            self._snp_chars
         )
 
         if self.verbose:
@@ -872,7 +1191,7 @@ class GenotypeData:
             verbose (bool, optional): If True, status updates are printed.
 
         Raises:
-            ValueError: If genotypes are not presented as a pair for each SNP.
+            ValueError: If the number of samples does not match the number of rows in snp_data.
 
             TypeError: If using snp_data, samples must also be provided.
         """
@@ -885,57 +1204,36 @@ class GenotypeData:
             )
 
         elif genotype_data is None and snp_data is None:
-            snp_data = self.snp_data
+            snp_data = self._snp_data
             samples = self.samples
-            snpsdict = self.snpsdict
 
         elif genotype_data is not None and snp_data is None:
-            snp_data = genotype_data.snp_data
+            snp_data = genotype_data._snp_data
             samples = genotype_data.samples
-            snpsdict = genotype_data.snpsdict
 
         elif genotype_data is None and snp_data is not None:
             if samples is None:
                 raise TypeError(
                     "If using snp_data, samples must also be provided."
                 )
-            snpsdict = self._make_snpsdict(samples=samples, snp_data=snp_data)
-
-        with open(output_file, "w") as fout:
-            for sample in samples:
-                genotypes = list(
-                    map(self._iupac_to_genotype, snpsdict[sample])
-                )
 
-                genotypes = [
-                    allele
-                    for genotype in genotypes
-                    for allele in genotype.split("/")
-                ]
-
-                # The genotypes must be presented as a pair for each SNP
-                if len(genotypes) % 2 != 0:
-                    raise ValueError(
-                        f"Genotypes for sample {sample} are not presented as pairs."
-                    )
+        codes = self._as_codes(snp_data)
+        if codes.shape[0] != len(samples):
+            raise ValueError(
+                f"The number of samples ({len(samples)}) does not match the "
+                f"number of rows in snp_data ({codes.shape[0]})."
+            )
 
-                # Split the genotypes into two lines for each sample
-                # Selects every other element of the list.
-                firstline_genotypes = genotypes[::2]
-                secondline_genotypes = genotypes[1::2]
+        firstline_genotypes = self._STRUCTURE_ALLELE_LUT[codes, 0]
+        secondline_genotypes = self._STRUCTURE_ALLELE_LUT[codes, 1]
 
-                fout.write(
-                    sample
-                    + "\t"
-                    + "\t".join(map(str, firstline_genotypes))
-                    + "\n"
-                )
-                fout.write(
-                    sample
-                    + "\t"
-                    + "\t".join(map(str, secondline_genotypes))
-                    + "\n"
-                )
+        with open(output_file, "w") as fout:
+            for sample, first, second in zip(
+                samples, firstline_genotypes, secondline_genotypes
+            ):
+                # Two lines per sample, one for each allele.
+                fout.write(sample + "\t" + "\t".join(first.tolist()) + "\n")
+                fout.write(sample + "\t" + "\t".join(second.tolist()) + "\n")
 
         if verbose:
             print("Successfully wrote STRUCTURE file!")
@@ -969,29 +1267,34 @@ class GenotypeData:
             print(f"\nReading phylip file {self.filename}...")
 
         self._check_filetype("phylip")
-        snp_data = list()
-        with open(self.filename, "r") as fin:
-            first = True
-            for line in fin:
-                line = line.strip()
-                if not line:  # If blank line.
-                    continue
-                if first:
-                    first = False
-                    continue
-                cols = line.split()
-                inds = cols[0]
-                seqs = cols[1]
-                snps = [snp for snp in seqs]  # Split each site.
-                snp_data.append(snps)
 
-                self._samples.append(inds)
+        lines = self._read_lines(self.filename)
+
+        num_inds, num_snps = map(int, lines[0].split())
+        if len(lines) - 1 != num_inds:
+            raise ValueError(
+                f"The number of individuals ({len(lines) - 1}) differs from "
+                f"the PHYLIP header line ({num_inds})."
+            )
+
+        # One row of ASCII nucleotide codes per sample.
+        snp_data = np.empty((num_inds, num_snps), dtype=np.uint8)
+        for i, line in enumerate(lines[1:]):
+            cols = line.split()
+            seq = np.frombuffer(cols[1], dtype=np.uint8)
+            if seq.size != num_snps:
+                raise ValueError(
+                    f"The sequence for sample {cols[0].decode()} has "
+                    f"{seq.size} sites, but the PHYLIP header specifies "
+                    f"{num_snps}."
+                )
+            snp_data[i] = seq
+            self._samples.append(cols[0].decode())
 
         self._snp_data = snp_data
-        self._validate_seq_lengths()
 
         self._ref, self._alt, self._alt2 = self._get_ref_alt_alleles(
-            self._snp_data
+            self._snp_chars
         )
 
         if self.verbose:
@@ -1005,6 +1308,8 @@ class GenotypeData:
         """
         Read a VCF file into a GenotypeData object.
 
+        BGZF-compressed VCF/BCF files are decompressed by htslib with ``self.threads`` threads, which can be set with the ``threads`` keyword argument to GenotypeData. Defaults to 1.
+
         Raises:
             ValueError: If the number of individuals differs from the header line.
         """
@@ -1014,7 +1319,7 @@ class GenotypeData:
         self._check_filetype("vcf")
 
         # Load the VCF file using pysam
-        vcf = VariantFile(self.filename, mode="r")
+        vcf = VariantFile(self.filename, mode="r", threads=self.threads)
 
         if self.popmapfile is not None:
             self._my_popmap = self.read_popmap(self.popmapfile)
@@ -1054,7 +1359,7 @@ class GenotypeData:
 
         Returns:
             str: File path to vcf_attributes.h5 HDF5 file.
-            List[List[str]]: snp_data 2D list object with IUPAC nucleotides.
+            numpy.ndarray: snp_data 2D uint8 array of IUPAC nucleotide codes.
             List[str]: List of sampleIDss found in alignment.
         """
 
@@ -1075,7 +1380,8 @@ class GenotypeData:
             return_indices=True,
         )
 
-        samples = [x for x in samples if x in self.samples]
+        kept_samples = set(self.samples)
+        samples = [x for x in samples if x in kept_samples]
 
         if len(samples) != len(sample_indices):
             new_header = pysam.VariantHeader()
@@ -1176,49 +1482,20 @@ class GenotypeData:
                 for k in format_fields
             }
 
-            # Define the mapping outside the function
-            IUPAC_MAPPING = {
-                ("A", "A"): "A",
-                ("A", "C"): "M",
-                ("A", "G"): "R",
-                ("A", "T"): "W",
-                ("C", "C"): "C",
-                ("C", "G"): "S",
-                ("C", "T"): "Y",
-                ("G", "G"): "G",
-                ("G", "T"): "K",
-                ("T", "T"): "T",
-                ("N", "N"): "N",
-                ("A", "N"): "A",
-                ("C", "N"): "C",
-                ("T", "N"): "T",
-                ("G", "N"): "G",
-            }
-
-            for data_type in [
-                "chrom",
-                "pos",
-                "ref",
-                "alt",
-                "qual",
-                "vcf_id",
-                "vcf_filter",
-                "info",
-                "format",
-                "calldata",
-                "snp_data",
-            ]:
-                if self.verbose:
-                    print(f"\nLoading {data_type}...")
-
-                for data in self.fetch_data(
-                    vcf,
-                    data_type,
-                    loci_indices,
-                    chunk_size,
-                    info_fields,
-                    IUPAC_MAPPING,
-                ):
+            if self.verbose:
+                print("\nLoading VCF records...")
+
+            # Every field is collected in a single pass over the file, one
+            # chunk of loci at a time.
+            snp_chunks = []
+            for chunk in self.fetch_data(
+                vcf,
+                loci_indices,
+                chunk_size,
+                info_fields,
+                self._IUPAC_PAIR_LUT,
+            ):
+                for data_type, data in chunk.items():
                     # Resize and write to datasets
                     if data_type == "chrom":
                         chrom_dset.resize((chrom_dset.shape[0] + len(data),))
@@ -1277,21 +1554,19 @@ class GenotypeData:
                             ]
 
                     elif data_type == "snp_data":
-                        snp_data = np.array(data, dtype=str)
+                        snp_data = data[:, sample_indices]
+                        snp_chunks.append(snp_data)
                         snp_data_dset.resize(
                             (snp_data_dset.shape[0] + len(data), len(samples))
                         )
-                        snp_data_dset[-len(data) :, :] = np.array(data)[
-                            :, sample_indices
-                        ]
-                vcf.reset()
+                        snp_data_dset[-len(data) :, :] = snp_data
 
-        snp_data = None
-        with h5py.File(h5_outfile, "r") as f:
-            # Load the entire dataset into a NumPy array
-            snp_data = f["snp_data"][:]
+            vcf.reset()
 
-        snp_data = np.array(snp_data, dtype=str)
+        if snp_chunks:
+            snp_data = self._as_codes(np.concatenate(snp_chunks).T)
+        else:
+            snp_data = np.empty((len(samples), 0), dtype=np.uint8)
 
         dir_path = os.path.join(
             f"{self.prefix}_output", "gtdata", "alignments", "vcf"
@@ -1299,135 +1574,137 @@ class GenotypeData:
         Path(dir_path).mkdir(exist_ok=True, parents=True)
         file_path = os.path.join(dir_path, "vcf_attributes.h5")
 
-        return file_path, snp_data.T.tolist(), samples
+        return file_path, snp_data, samples
 
     def fetch_data(
         self,
         vcf,
-        data_type,
         loci_indices,
         chunk_size,
         info_fields,
-        IUPAC_MAPPING,
+        iupac_lut,
     ):
-        def transform_gt(gt, ref, alt):
-            gt_array = np.array(gt)
+        """Read all VCF record fields in a single pass, one chunk of loci at a time.
 
-            try:
-                alt_array = [ref] + list(
-                    alt
-                )  # Adding the reference at the beginning
-            except TypeError:
-                alt_array = [ref] + list(".")
-
-            # Function to apply transformation for each pair
-            def transform_pair(pair):
-                allele1, allele2 = pair
-                if allele1 is None or allele2 is None:
-                    return "N"
-                a1, a2 = alt_array[allele1], alt_array[allele2]
-                a1, a2 = sorted(
-                    [a1, a2]
-                )  # Sort the alleles to ensure the correct mapping
-                return IUPAC_MAPPING[(a1, a2)]
-
-            return list(map(transform_pair, gt_array))
-
-        # Initialize the data containers for each data type
-        data_containers = {
-            "chrom": [],
-            "pos": [],
-            "vcf_id": [],
-            "ref": [],
-            "alt": [],
-            "qual": [],
-            "vcf_filter": [],
-            "format": [],
-            "snp_data": [],
-            "info": defaultdict(list),
-            "calldata": defaultdict(list),
-        }
+        Args:
+            vcf (pysam.VariantFile): pysam.VariantFile object.
+            loci_indices (List[int] or None): Loci indices to include. If None, all loci are used.
+            chunk_size (int): Number of loci per chunk.
+            info_fields (List[str]): INFO fields to read.
+            iupac_lut (numpy.ndarray): IUPAC code for each pair of allele indices (see ``_IUPAC_PAIR_LUT``).
+
+        Yields:
+            Dict[str, Any]: Data for each field ("chrom", "pos", "vcf_id", "ref", "alt", "qual", "vcf_filter", "format", "info", "calldata", and "snp_data") in the chunk. "info" and "calldata" map each field to its values, and "snp_data" is a (n_loci, n_samples) array of IUPAC codes.
+        """
+        base_index = self._BASE_INDEX
+        if loci_indices is not None:
+            loci_indices = set(loci_indices)
+
+        def transform_gt(gts, alleles):
+            # (n_variants, n_samples, ploidy) allele indices for the whole
+            # chunk; None (missing) allele indices become NaN.
+            gt_array = np.array(gts, dtype=float)
+            n_alleles = max(len(a) for a in alleles)
+
+            # Both alleles of a missing genotype point at the padding column,
+            # so the IUPAC lookup itself yields 'N' without a separate pass.
+            gt_array[np.isnan(gt_array).any(axis=2)] = n_alleles
+            gt_array = gt_array.astype(np.intp)
+
+            # Row/column index into the IUPAC table for the REF and each ALT
+            # allele of every variant, padded with the 'other' index.
+            allele_idx = np.full(
+                (len(alleles), n_alleles + 1), 4, dtype=np.intp
+            )
+            for j, variant_alleles in enumerate(alleles):
+                allele_idx[j, : len(variant_alleles)] = [
+                    base_index.get(a, 4) for a in variant_alleles
+                ]
+
+            # Look up both alleles of every genotype in one call each.
+            first = np.take_along_axis(allele_idx, gt_array[:, :, 0], axis=1)
+            second = np.take_along_axis(allele_idx, gt_array[:, :, -1], axis=1)
+
+            return iupac_lut[first, second]
+
+        def new_chunk():
+            return {
+                "chrom": [],
+                "pos": [],
+                "vcf_id": [],
+                "ref": [],
+                "alt": [],
+                "qual": [],
+                "vcf_filter": [],
+                "format": [],
+                "snp_data": [],
+                "info": defaultdict(list),
+                "calldata": defaultdict(list),
+            }
+
+        def finish_chunk(chunk, snp_alleles):
+            chunk["snp_data"] = transform_gt(chunk["snp_data"], snp_alleles)
+            return chunk
+
+        chunk = new_chunk()
+
+        # REF and ALT alleles of each variant in the current chunk.
+        snp_alleles = []
 
         for i, variant in enumerate(vcf.fetch()):
             # Process only the required variants if loci_indices is provided
             if loci_indices is not None and i not in loci_indices:
                 continue
 
-            # Process the specific data type
-            if data_type == "chrom":
-                data_containers["chrom"].append(variant.chrom)
-            elif data_type == "pos":
-                data_containers["pos"].append(variant.pos)
-            elif data_type == "vcf_id":
-                data_containers["vcf_id"].append(
-                    "." if variant.id is None else variant.id
-                )
-            elif data_type == "ref":
-                data_containers["ref"].append(variant.ref)
-            elif data_type == "alt":
-                if variant.alts is None:
-                    data_containers["alt"].append(".")
-                else:
-                    data_containers["alt"].append(",".join(list(variant.alts)))
-            elif data_type == "qual":
-                data_containers["qual"].append(variant.qual)
-            elif data_type == "vcf_filter":
-                data_containers["vcf_filter"].append(variant.filter)
-            elif data_type == "format":
-                data_containers["format"].append(
-                    ":".join(list(variant.format.keys()))
+            chunk["chrom"].append(variant.chrom)
+            chunk["pos"].append(variant.pos)
+            chunk["vcf_id"].append("." if variant.id is None else variant.id)
+            chunk["ref"].append(variant.ref)
+            if variant.alts is None:
+                chunk["alt"].append(".")
+            else:
+                chunk["alt"].append(",".join(list(variant.alts)))
+            chunk["qual"].append(variant.qual)
+            chunk["vcf_filter"].append(variant.filter)
+            chunk["format"].append(":".join(list(variant.format.keys())))
+
+            for k in info_fields:
+                value = variant.info.get(k, ".")
+                processed_value = (
+                    ",".join(list(value)) if isinstance(value, tuple) else value
                 )
-            elif data_type == "snp_data":
-                gt = [
-                    variant.samples[sample].get("GT", "./.")
-                    for sample in variant.samples
-                ]
+                chunk["info"][k].append(processed_value)
 
-                snp_data = transform_gt(gt, variant.ref, variant.alts)
-                data_containers["snp_data"].append(snp_data)
+            sample_records = list(variant.samples.values())
 
-            elif data_type == "info":
-                for k in info_fields:
-                    value = variant.info.get(k, ".")
-                    processed_value = (
-                        ",".join(list(value))
-                        if isinstance(value, tuple)
-                        else value
-                    )
-                    data_containers["info"][k].append(processed_value)
-
-            elif data_type == "calldata":
-                for field in variant.format.keys():
-                    if field != "GT":
-                        key = field
-                        value = [
-                            ",".join(
-                                list(variant.samples[sample].get(field, (".")))
-                            )
-                            if isinstance(
-                                variant.samples[sample].get(field), tuple
-                            )
-                            else variant.samples[sample].get(field, ".")
-                            for sample in variant.samples
-                        ]
-                        data_containers["calldata"][key].append(value)
+            for field in variant.format.keys():
+                if field != "GT":
+                    value = [
+                        ",".join(list(record.get(field, ".")))
+                        if isinstance(record.get(field), tuple)
+                        else record.get(field, ".")
+                        for record in sample_records
+                    ]
+                    chunk["calldata"][field].append(value)
 
-            # If reached chunk size, yield and reset current chunk
-            if (i + 1) % chunk_size == 0:
-                yield data_containers[data_type]
+            chunk["snp_data"].append(
+                [record.get("GT", "./.") for record in sample_records]
+            )
+            snp_alleles.append(
+                [variant.ref]
+                if variant.alts is None
+                else [variant.ref, *variant.alts]
+            )
 
-                if data_type in ["calldata", "info"]:
-                    data_containers[data_type] = defaultdict(list)
-                else:
-                    data_containers[data_type] = []
+            # If reached chunk size, yield and reset current chunk
+            if (i + 1) % chunk_size == 0 and chunk["chrom"]:
+                yield finish_chunk(chunk, snp_alleles)
+                chunk = new_chunk()
+                snp_alleles = []
 
         # Yield remaining data if any
-        if data_containers[data_type]:
-            yield data_containers[data_type]
-            if data_type in ["calldata", "info"]:
-                data_containers[data_type] = defaultdict(list)
-            else:
-                data_containers[data_type] = []
+        if chunk["chrom"]:
+            yield finish_chunk(chunk, snp_alleles)
 
     def _get_ref_alt_alleles(
         self,
@@ -1514,33 +1791,37 @@ class GenotypeData:
             less_common_alleles_list,
         )
 
-    def _snpdata2gtarray(self, snpdata):
-        iupac_codes = {
-            "M": ("A", "C"),
-            "R": ("A", "G"),
-            "W": ("A", "T"),
-            "S": ("C", "G"),
-            "Y": ("C", "T"),
-            "K": ("G", "T"),
-            "A": ("A", "A"),
-            "T": ("T", "T"),
-            "G": ("G", "G"),
-            "C": ("C", "C"),
-            "N": ("N", "N"),
-            "-": ("N", "N"),
-            "?": ("N", "N"),
-        }
+    @staticmethod
+    def _join_str_arrays(arrays: Iterable[np.ndarray], sep: str) -> np.ndarray:
+        """Join equally shaped string arrays element-wise with a separator.
+
+        Equivalent to calling ``sep.join()`` on the values at each position across ``arrays``, but uses vectorized ``np.char.add`` calls instead of a Python-level call per element. The arrays are consumed one at a time, so a generator avoids holding all of them in memory.
 
-        # Convert the 2D list to a numpy array and transpose it
-        snpdata_array = np.array(snpdata).T
+        Args:
+            arrays (Iterable[numpy.ndarray]): Non-empty iterable of arrays with the same shape. Values are converted to strings.
+            sep (str): Separator to insert between the values.
+
+        Returns:
+            numpy.ndarray: Array of joined strings with the same shape as the inputs.
+        """
+        arrays = iter(arrays)
+        joined = np.asarray(next(arrays)).astype(str)
+        for arr in arrays:
+            joined = np.char.add(
+                np.char.add(joined, sep), np.asarray(arr).astype(str)
+            )
+        return joined
 
-        # Use vectorization to map the IUPAC codes to pairs of nucleotides
-        snpdata_tuples = np.vectorize(iupac_codes.get)(snpdata_array)
+    def _snpdata2gtarray(self, snpdata):
+        """Split IUPAC genotypes into their two alleles.
 
-        # Convert the tuple of arrays into a 3D array
-        snpdata_tuples = np.stack(snpdata_tuples, axis=-1)
+        Args:
+            snpdata (numpy.ndarray or List[List[str]]): IUPAC genotypes of shape (n_samples, n_loci).
 
-        return snpdata_tuples
+        Returns:
+            numpy.ndarray: Alleles of shape (n_loci, n_samples, 2). Missing and unrecognized genotypes give ("N", "N").
+        """
+        return self._IUPAC_ALLELE_LUT[self._as_codes(snpdata).T]
 
     def write_phylip(
         self,
@@ -1577,27 +1858,27 @@ class GenotypeData:
                 "genotype_data and snp_data cannot both be NoneType"
             )
         elif genotype_data is None and snp_data is None:
-            snp_data = self.snp_data
+            snp_data = self._snp_data
             samples = self.samples
         elif genotype_data is not None and snp_data is None:
-            snp_data = genotype_data.snp_data
+            snp_data = genotype_data._snp_data
             samples = genotype_data.samples
         elif genotype_data is None and snp_data is not None:
             if samples is None:
                 raise TypeError("samples must be provided if snp_data is None")
 
-        if len(samples) != len(snp_data):
+        codes = self._as_codes(snp_data)
+
+        if len(samples) != len(codes):
             raise ValueError(
-                f"samples and snp_data are not the same length: {len(samples)}, {len(snp_data)}"
+                f"samples and snp_data are not the same length: {len(samples)}, {len(codes)}"
             )
 
         with open(output_file, "w") as f:
-            aln = pd.DataFrame(snp_data)
-            n_samples, n_loci = aln.shape
+            n_samples, n_loci = codes.shape
             f.write(f"{n_samples} {n_loci}\n")
-            for sample, sample_data in zip(samples, snp_data):
-                genotype_data = "".join(str(x) for x in sample_data)
-                f.write(f"{sample}\t{genotype_data}\n")
+            for sample, row in zip(samples, codes):
+                f.write(f"{sample}\t{row.tobytes().decode('ascii')}\n")
 
         if verbose:
             print(f"Successfully wrote PHYLIP file!")
@@ -1697,59 +1978,56 @@ class GenotypeData:
             ns = self.calculate_ns(self.snp_data)
             af = self.calculate_af(self.snp_data, self.alt)
 
-            vcf_attributes = {
-                "chrom": [f"locus_{i}" for i in range(self.num_snps)],
-                "pos": ["1" for x in range(self.num_snps)],
-                "id": ["." for x in range(self.num_snps)],
-                "ref": [x if x is not None else "N" for x in self.ref],
-                "alt": ["." if x is None else x for x in self.alt],
-                "qual": ["." for x in range(self.num_snps)],
-                "filter": ["." for x in range(self.num_snps)],
-                "info": {
-                    "NS": [f"NS={v}" for v in ns],
-                    "MAF": [f"AF={round(x, 3)}" for x in af],
-                },
-                "format": ["GT" for x in range(self.num_snps)],
-            }
+            alt = ["." if x is None else x for x in self.alt]
 
-            vcf_attributes["alt"] = [
-                [x] + y if y else [x]
-                for x, y in zip(vcf_attributes["alt"], self._alt2)
-            ]
-            vcf_attributes["alt"] = [
-                ",".join(x) for x in vcf_attributes["alt"]
-            ]
+            vcf_attributes = VCFAttributes(
+                chrom=np.array([f"locus_{i}" for i in range(self.num_snps)]),
+                pos=np.full(self.num_snps, "1"),
+                id=np.full(self.num_snps, "."),
+                ref=np.array([x if x is not None else "N" for x in self.ref]),
+                alt=np.array(
+                    [
+                        ",".join([x] + y if y else [x])
+                        for x, y in zip(alt, self._alt2)
+                    ]
+                ),
+                qual=np.full(self.num_snps, "."),
+                filter=np.full(self.num_snps, "."),
+                info={
+                    "NS": np.array([f"NS={v}" for v in ns]),
+                    "MAF": np.array([f"AF={round(x, 3)}" for x in af]),
+                },
+                format=np.full(self.num_snps, "GT"),
+            )
 
-            # IUPAC ambiguity codes mapping
-            iupac_mapping = {
-                "R": "0/1",
-                "Y": "0/1",
-                "S": "0/1",
-                "W": "0/1",
-                "K": "0/1",
-                "M": "0/1",
-                "B": "0/1",
-                "D": "0/1",
-                "H": "0/1",
-                "V": "0/1",
-            }
+            # Genotype for every byte value that is neither the REF nor an
+            # ALT allele: IUPAC ambiguity codes are heterozygous, missing
+            # data is './.', and anything else is written unchanged.
+            gt_lut = np.array([chr(c) for c in range(256)], dtype="<U3")
+            for iupac in "RYSWKMBDHV":
+                gt_lut[ord(iupac)] = "0/1"
+            for missing in "N-?":
+                gt_lut[ord(missing)] = "./."
+
+            # (n_loci, n_samples) matrix of byte codes.
+            codes = self._snp_data.T
+            ref_codes = vcf_attributes.ref.astype("S1").view(np.uint8)
+
+            alt_table = np.zeros((self.num_snps, 256), dtype=bool)
+            for i, alt_alleles in enumerate(vcf_attributes.alt):
+                alt_table[i, [ord(a) for a in alt_alleles]] = True
+
+            gt = np.where(
+                codes == ref_codes[:, None],
+                "0/0",
+                np.where(
+                    np.take_along_axis(alt_table, codes.astype(np.intp), 1),
+                    "1/1",
+                    gt_lut[codes],
+                ),
+            )
 
-            def replace_alleles(row, ref, alt):
-                for i in range(9, len(row)):
-                    # Replace the reference allele with "0/0"
-                    row[i] = row[i].replace(ref, "0/0")
-                    # Replace any alternate allele with "1/1"
-                    for a in alt:
-                        row[i] = row[i].replace(a, "1/1")
-                    # Replace IUPAC ambiguity codes with "0/1"
-                    for iupac, replacement in iupac_mapping.items():
-                        row[i] = row[i].replace(iupac, replacement)
-                    row[i] = row[i].replace("N", "./.")
-                    row[i] = row[i].replace("-", "./.")
-                    row[i] = row[i].replace("?", "./.")
-                return "\t".join(row) + "\n"
-
-            with open(output_filename, "w") as fout:
+            with self._open_output(output_filename) as fout:
                 sample_header = "\t".join(self.samples)
 
                 vcf_header = textwrap.dedent(
@@ -1763,48 +2041,38 @@ class GenotypeData:
                     ##FORMAT=<ID=GT,Number=1,Type=String,Description="Genotype">
                     #CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\t{sample_header}\n"""
                 )
-                gt = np.array(self.snp_data, dtype=str).T.tolist()
-                gt_joined = ["\t".join(list(map(str, x))) for x in gt]
-
-                info = {k: f"{k}={str(v)}" for k, v in vcf_attributes.items()}
-                info_joined = [
-                    ";".join(list(map(str, values)))
-                    for values in zip(*vcf_attributes["info"].values())
-                ]
-                vcf_attributes["info"] = info_joined
-
-                vcf_attributes["calldata"] = gt_joined
-
-                lines_data = []
-                for i in range(self.num_snps):
-                    line = [
-                        vcf_attributes["chrom"][i],
-                        vcf_attributes["pos"][i],
-                        vcf_attributes["id"][i],
-                        vcf_attributes["ref"][i],
-                        vcf_attributes["alt"][i],
-                        vcf_attributes["qual"][i],
-                        vcf_attributes["filter"][i],
-                        vcf_attributes["info"][i],
-                        vcf_attributes["format"][i],
-                        vcf_attributes["calldata"][i],
-                    ]
-                    lines_data.append(list(map(str, line)))
-
-                new_lines = [
-                    replace_alleles(row, ref, alt)
-                    for row, ref, alt in zip(
-                        lines_data,
-                        vcf_attributes["ref"],
-                        vcf_attributes["alt"],
-                    )
-                ]
+                vcf_attributes.calldata = gt
 
-                # new_lines = align_columns(new_lines, alignment="left")
+                fixed_cols = self._join_str_arrays(
+                    [
+                        vcf_attributes.chrom,
+                        vcf_attributes.pos,
+                        vcf_attributes.id,
+                        vcf_attributes.ref,
+                        vcf_attributes.alt,
+                        vcf_attributes.qual,
+                        vcf_attributes.filter,
+                        self._join_str_arrays(
+                            list(vcf_attributes.info.values()), ";"
+                        ),
+                        vcf_attributes.format,
+                    ],
+                    "\t",
+                )
 
                 fout.write(vcf_header)
-                for line in new_lines:
-                    fout.write(line)
+
+                # Write all records with a single call.
+                fout.write(
+                    "".join(
+                        [
+                            "\t".join([fixed, *row]) + "\n"
+                            for fixed, row in zip(
+                                fixed_cols.tolist(), gt.tolist()
+                            )
+                        ]
+                    )
+                )
 
             if self.verbose:
                 print("\nSuccessfully wrote VCF file!\n")
@@ -1814,28 +2082,21 @@ class GenotypeData:
         if hdf5_file_path is None:
             hdf5_file_path = self.vcf_attributes
 
-        def replace_alleles(row, ref, alt):
-            for i in range(9, len(row)):
-                # Replace the reference allele with "0"
-                row[i] = row[i].replace(ref, "0")
-                # Replace any alternate allele with "1"
-                for a in alt:
-                    row[i] = row[i].replace(a, "1")
-            return ["\t".join(str(x)) + "\n" for x in row]
 
         # 1. Opening the HDF5 File and VCF File
         with h5py.File(hdf5_file_path, "r") as hdf5_file:
             vcf_header = self.vcf_header
-            with open(output_filename, "w") as f:
+            with self._open_output(output_filename) as f:
                 for header_record in vcf_header.records:
                     f.write(str(header_record))
                 sample_header = "\t".join(self.samples)
                 f.write(
-                    textwrap.dedent(
-                        f"#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\t{sample_header}\n"
-                    )
+                    f"#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\t{sample_header}\n"
                 )
 
+                info_keys = list(hdf5_file["info"].keys())
+                calldata_keys = list(hdf5_file["calldata"].keys())
+
                 # 2. Reading Attributes in Chunks
                 for start in range(0, len(hdf5_file["chrom"]), chunk_size):
                     end = min(start + chunk_size, len(hdf5_file["chrom"]))
@@ -1848,15 +2109,12 @@ class GenotypeData:
                     alt = hdf5_file["alt"][start:end]
                     qual = hdf5_file["qual"][start:end]
                     fltr = hdf5_file["filter"][start:end]
-                    info_keys = list(hdf5_file["info"].keys())
                     info = defaultdict(list)
                     for k in info_keys:
                         info[k] = hdf5_file[f"info/{k}"][start:end]
 
                     fmt = hdf5_file["format"][start:end]
 
-                    calldata_keys = list(hdf5_file["calldata"].keys())
-
                     calldata = defaultdict(list)
                     for k in calldata_keys:
                         calldata[k] = hdf5_file[f"calldata/{k}"][start:end, :]
@@ -1884,27 +2142,10 @@ class GenotypeData:
                     # Extract the values corresponding to the order in fmt_keys
                     calldata_list = [calldata[k] for k in fmt_keys]
 
-                    # Transpose the list of lists
-                    calldata_transposed = list(map(list, zip(*calldata_list)))
-
-                    # Join the corresponding elements of the lists
-                    calldata_str = [
-                        [
-                            ":".join(
-                                [
-                                    e.decode()
-                                    if isinstance(e, bytes)
-                                    else str(e)
-                                    for e in row
-                                ]
-                            )
-                            for row in zip(*rows)
-                        ]
-                        for rows in calldata_transposed
-                    ]
-
-                    # Convert to a NumPy array
-                    calldata_str_array = np.array(calldata_str, dtype=str)
+                    # Join the per-sample FORMAT values with ':'.
+                    calldata_str_array = self._join_str_arrays(
+                        calldata_list, ":"
+                    )
 
                     # 3. Processing the Chunk
                     # Convert the data into the required format
@@ -1917,30 +2158,49 @@ class GenotypeData:
                     fltr_str = fltr.astype(str)
                     fmt_str = fmt.astype(str)
 
-                    snp_data = np.array(self.snp_data, dtype=str)[:, start:end]
+                    snp_data = self._snp_data[:, start:end]
 
                     # Create the genotype string
                     gt = self._snpdata2gtarray(snp_data)
-                    gt_0 = gt[:, :, 0].astype(str)
-                    gt_1 = gt[:, :, 1].astype(str)
-                    gt_joined = np.char.add(np.char.add(gt_0, "/"), gt_1)
-                    gt_joined[gt_joined == "N/N"] = "./."
-                    gt_joined = np.char.add(gt_joined, ":")
-                    gt_joined = gt_joined.astype(str)
-                    gt_joined = np.char.add(gt_joined, calldata_str_array)
 
-                    info_arrays = {
-                        key: np.char.add(f"{key}=", value.astype(str))
-                        for key, value in info.items()
-                    }
+                    # Missingness straight from the raw genotype codes.
+                    is_missing = self._IUPAC_MISSING[snp_data.T]
+
+                    # Recode the REF allele as 0 and any ALT allele as 1.
+                    alt_table = np.zeros((len(alt_str), 256), dtype=bool)
+                    for i, alts in enumerate(alt_str):
+                        alt_table[
+                            i, [ord(a) for a in alts.split(",") if len(a) == 1]
+                        ] = True
+                    gt_codes = gt.astype("S1").view(np.uint8)
+                    is_alt = alt_table[
+                        np.arange(len(alt_str))[:, None, None], gt_codes
+                    ]
+                    gt = np.where(
+                        gt == ref[:, None, None],
+                        "0",
+                        np.where(is_alt, "1", gt),
+                    )
+
+                    # Mark missing alleles before the join so that missing
+                    # genotypes come out as './.'.
+                    gt[is_missing] = "."
 
-                    info_arrays = np.array(
-                        list(info_arrays.values()), dtype=str
+                    gt_joined = self._join_str_arrays(
+                        [gt[:, :, 0], gt[:, :, 1]], "/"
                     )
+                    gt_joined = np.char.add(gt_joined, ":")
+                    gt_joined = gt_joined.astype(str)
+                    gt_joined = np.char.add(gt_joined, calldata_str_array)
 
-                    # Join the elements along the last axis
-                    info_result = np.apply_along_axis(
-                        lambda x: ";".join(x), 0, info_arrays
+                    # Each KEY=value array is folded into the joined INFO
+                    # column as soon as it is built.
+                    info_result = self._join_str_arrays(
+                        (
+                            np.char.add(f"{key}=", value.astype(str))
+                            for key, value in info.items()
+                        ),
+                        ";",
                     )
 
                     # Concatenate the data into lines
@@ -1960,26 +2220,30 @@ class GenotypeData:
                     )
                     lines = np.hstack((lines_data, gt_joined))
 
-                    # Replace alleles with numerical values
-                    ref_alleles = lines[:, 3]
-                    alt_alleles = [
-                        alt_str.strip().split(",") for alt_str in lines[:, 4]
-                    ]
-                    new_lines = [
-                        replace_alleles(row, ref, alt)
-                        for row, ref, alt in zip(
-                            lines, ref_alleles, alt_alleles
-                        )
-                    ]
-                    new_lines = ["\t".join(x) + "\n" for x in lines]
-
                     # 4. Writing the Chunk to the VCF File
-                    # Write the processed lines for this chunk to the VCF file
-                    f.writelines(new_lines)
+                    # Write the processed lines for this chunk with a single
+                    # call.
+                    f.write(
+                        "".join(["\t".join(x) + "\n" for x in lines.tolist()])
+                    )
 
         if self.verbose:
             print("\nSuccessfully wrote VCF file!\n")
 
+    @staticmethod
+    def _open_output(filename: str):
+        """Open a text file for writing with a large buffer, gzip-compressing it if the filename ends with '.gz'.
+
+        Args:
+            filename (str): Path to the output file.
+
+        Returns:
+            io.TextIOBase: File object opened for writing.
+        """
+        if str(filename).endswith(".gz"):
+            return gzip.open(filename, "wt")
+        return open(filename, "w", buffering=1 << 20)
+
     def read_012(self) -> None:
         """
         Read 012-encoded comma-delimited file.
@@ -1994,19 +2258,13 @@ class GenotypeData:
         snp_data = list()
         num_snps = list()
 
-        with open(self.filename, "r") as fin:
-            num_inds = 0
-            for line in fin:
-                line = line.strip()
-                if not line:
-                    continue
-                cols = line.split(",")
-                inds = cols[0]
-                snps = cols[1:]
-                num_snps.append(len(snps))
-                num_inds += 1
-                snp_data.append(snps)
-                self._samples.append(inds)
+        for line in self._read_lines(self.filename):
+            cols = line.decode().split(",")
+            inds = cols[0]
+            snps = cols[1:]
+            num_snps.append(len(snps))
+            snp_data.append(snps)
+            self._samples.append(inds)
 
         if len(list(set(num_snps))) > 1:
             raise ValueError(
@@ -2018,7 +2276,7 @@ class GenotypeData:
         df.replace("NA", "-9", inplace=True)
         df = df.astype("int")
 
-        # Decodes 012 and converts to self._snp_data List[List[str]]
+        # Decodes 012 and stores the IUPAC codes in self._snp_data
         self.genotypes_012 = df
 
         self._ref = None
@@ -2043,7 +2301,7 @@ class GenotypeData:
         Args:
             snps (List[List[str]]): 2D list of genotypes of shape (n_samples, n_sites).
 
-            vcf (bool, optional): Whether or not VCF file input is provided. Not yet supported. Defaults to False.
+            vcf (bool, optional): If True, genotypes are VCF-style allele pairs separated by "/" (e.g., "A/T") instead of IUPAC codes. Defaults to False.
 
             impute_mode (bool, optional): Whether or not ``convert_012()`` is called in impute mode. If True, then returns the 012-encoded genotypes and does not set the ``self.snp_data`` property. If False, it does the opposite. Defaults to False.
 
@@ -2061,169 +2319,48 @@ class GenotypeData:
         Todo:
             skip and impute_mode are now deprecated.
         """
-        warnings.formatwarning = self._format_warning
-
-        skip = 0
-        snps_012 = []
-        new_snps = []
-        monomorphic_sites = []
-        non_biallelic_sites = []
-        all_missing = []
+        # TODO: skip and impute_mode are now deprecated.
+        new_snps = self._convert_012_array(snps, vcf=vcf).tolist()
 
         if impute_mode:
-            imp_snps = list()
-
-        for i in range(0, len(snps)):
-            new_snps.append([])
-
-        # TODO: valid_sites is now deprecated.
-        valid_sites = np.ones(len(snps[0]))
-        for j in range(0, len(snps[0])):
-            loc = []
-            for i in range(0, len(snps)):
-                if vcf:
-                    loc.append(snps[i][j])
-                else:
-                    loc.append(snps[i][j].upper())
-
-            if all(x == "N" for x in loc):
-                all_missing.append(j)
-                continue
-            num_alleles = sequence_tools.count_alleles(loc, vcf=vcf)
-            if num_alleles != 2:
-                # If monomorphic
-                if num_alleles < 2:
-                    monomorphic_sites.append(j)
-                    try:
-                        ref = list(
-                            map(
-                                sequence_tools.get_major_allele,
-                                loc,
-                                [vcf for x in loc],
-                            )
-                        )
-                        ref = str(ref[0])
-                    except IndexError:
-                        ref = list(
-                            map(
-                                sequence_tools.get_major_allele,
-                                loc,
-                                [vcf for x in loc],
-                            )
-                        )
-                    alt = None
-
-                    if vcf:
-                        for i in range(0, len(snps)):
-                            gen = snps[i][j].split("/")
-                            if gen[0] in ["-", "-9", "N"] or gen[1] in [
-                                "-",
-                                "-9",
-                                "N",
-                            ]:
-                                new_snps[i].append(-9)
-
-                            elif gen[0] == gen[1] and gen[0] == ref:
-                                new_snps[i].append(0)
-
-                            else:
-                                new_snps[i].append(1)
-                    else:
-                        for i in range(0, len(snps)):
-                            if loc[i] in ["-", "-9", "N"]:
-                                new_snps[i].append(-9)
-
-                            elif loc[i] == ref:
-                                new_snps[i].append(0)
-
-                            else:
-                                new_snps[i].append(1)
-
-                # If >2 alleles
-                elif num_alleles > 2:
-                    non_biallelic_sites.append(j)
-                    all_alleles = sequence_tools.get_major_allele(loc, vcf=vcf)
-                    all_alleles = [str(x[0]) for x in all_alleles]
-                    ref = all_alleles.pop(0)
-                    alt = all_alleles.pop(0)
-                    others = all_alleles
-
-                    if vcf:
-                        for i in range(0, len(snps)):
-                            gen = snps[i][j].split("/")
-                            if gen[0] in ["-", "-9", "N"] or gen[1] in [
-                                "-",
-                                "-9",
-                                "N",
-                            ]:
-                                new_snps[i].append(-9)
-
-                            elif gen[0] == gen[1] and gen[0] == ref:
-                                new_snps[i].append(0)
-
-                            elif gen[0] == gen[1] and gen[0] == alt:
-                                new_snps[i].append(2)
-
-                            # Force biallelic
-                            elif gen[0] == gen[1] and gen[0] in others:
-                                new_snps[i].append(2)
-
-                            else:
-                                new_snps[i].append(1)
-                    else:
-                        for i in range(0, len(snps)):
-                            if loc[i] in ["-", "-9", "N"]:
-                                new_snps[i].append(-9)
-
-                            elif loc[i] == ref:
-                                new_snps[i].append(0)
+            # TODO: valid_sites is now deprecated.
+            valid_sites = np.ones(len(snps[0]))
+            return (
+                new_snps,
+                valid_sites,
+                np.count_nonzero(~np.isnan(valid_sites)),
+            )
+        else:
+            return new_snps
 
-                            elif loc[i] == alt:
-                                new_snps[i].append(2)
+    def _convert_012_array(
+        self, snps: Union[np.ndarray, List[List[str]]], vcf: bool = False
+    ) -> np.ndarray:
+        """012-encode genotypes and log monomorphic, non-biallelic, and all-missing sites.
 
-                            # Force biallelic
-                            elif loc[i] in others:
-                                new_snps[i].append(2)
+        This is the array-returning core of ``convert_012()``.
 
-                            else:
-                                new_snps[i].append(1)
+        Args:
+            snps (numpy.ndarray or List[List[str]]): Genotypes of shape (n_samples, n_sites).
 
-            else:
-                ref, alt = sequence_tools.get_major_allele(loc, vcf=vcf)
-                ref = str(ref)
-                alt = str(alt)
-
-                if vcf:
-                    for i in range(0, len(snps)):
-                        gen = snps[i][j].split("/")
-                        if gen[0] in ["-", "-9", "N"] or gen[1] in [
-                            "-",
-                            "-9",
-                            "N",
-                        ]:
-                            new_snps[i].append(-9)
-
-                        elif gen[0] == gen[1] and gen[0] == ref:
-                            new_snps[i].append(0)
-
-                        elif gen[0] == gen[1] and gen[0] == alt:
-                            new_snps[i].append(2)
-
-                        else:
-                            new_snps[i].append(1)
-                else:
-                    for i in range(0, len(snps)):
-                        if loc[i] in ["-", "-9", "N"]:
-                            new_snps[i].append(-9)
+            vcf (bool, optional): If True, genotypes are VCF-style allele pairs separated by "/" instead of IUPAC codes. Defaults to False.
 
-                        elif loc[i] == ref:
-                            new_snps[i].append(0)
+        Returns:
+            numpy.ndarray: 012-encoded int8 genotypes of shape (n_samples, n_retained_sites).
 
-                        elif loc[i] == alt:
-                            new_snps[i].append(2)
+        Warnings:
+            UserWarning: If site is monomorphic.
+            UserWarning: If site has >2 alleles.
+        """
+        warnings.formatwarning = self._format_warning
 
-                        else:
-                            new_snps[i].append(1)
+        encode = self._encode_012_vcf if vcf else self._encode_012_iupac
+        (
+            encoded,
+            monomorphic_sites,
+            non_biallelic_sites,
+            all_missing,
+        ) = encode(snps)
 
         outdir = os.path.join(f"{self.prefix}_output", "gtdata", "logs")
         Path(outdir).mkdir(exist_ok=True, parents=True)
@@ -2262,30 +2399,161 @@ class GenotypeData:
                 f" SNP column indices found in the log file {outfile} had all missing data and were excluded from the alignment.\n"
             )
 
-        # TODO: skip and impute_mode are now deprecated.
-        if skip > 0:
-            if impute_mode:
-                print(
-                    f"\nWarning: Skipping {skip} non-biallelic sites following "
-                    "imputation\n"
-                )
-            else:
-                print(f"\nWarning: Skipping {skip} non-biallelic sites\n")
+        return encoded
 
-        for s in new_snps:
-            if impute_mode:
-                imp_snps.append(s)
-            else:
-                snps_012.append(s)
+    @staticmethod
+    def _encode_012_iupac(
+        snps: Union[np.ndarray, List[List[str]]]
+    ) -> Tuple[np.ndarray, List[int], List[int], List[int]]:
+        """Vectorized 012-encoding of IUPAC genotypes, one column per site.
 
-        if impute_mode:
-            return (
-                imp_snps,
-                valid_sites,
-                np.count_nonzero(~np.isnan(valid_sites)),
-            )
-        else:
-            return snps_012
+        The two most common nucleotides at each site (ties broken by first occurrence, as with ``sequence_tools.get_major_allele``) are the reference and alternate alleles. Homozygous reference genotypes are encoded as 0, any other homozygous nucleotide as 2 (forcing multi-allelic sites to be bi-allelic), missing data ("N", "-", "?") as -9, and everything else as 1. Sites where every genotype is "N" are dropped.
+
+        Args:
+            snps (numpy.ndarray or List[List[str]]): IUPAC genotypes of shape (n_samples, n_sites).
+
+        Returns:
+            numpy.ndarray: 012-encoded int8 genotypes of shape (n_samples, n_retained_sites).
+            List[int]: Indices of monomorphic sites.
+            List[int]: Indices of sites with more than two alleles.
+            List[int]: Indices of sites with all missing data.
+        """
+        codes = np.asarray(snps)
+        if codes.dtype != np.uint8:
+            codes = np.asarray(codes, dtype="S1").view(np.uint8)
+
+        # Uppercase with a byte table instead of a string operation.
+        upper = np.arange(256, dtype=np.uint8)
+        upper[ord("a") : ord("z") + 1] -= ord("a") - ord("A")
+        codes = upper[codes]
+
+        # Copies of each base (A, C, G, T) in each IUPAC code, and the
+        # position of its first copy in the code's allele pair. Any code
+        # without a nucleotide (e.g., N, -, B, D, H, V) has no copies.
+        bases = np.frombuffer(b"ACGT", dtype=np.uint8)
+        base_count = np.zeros((256, 4), dtype=np.int8)
+        base_pos = np.zeros((256, 4), dtype=np.int8)
+        for code, pair in {
+            "A": "AA",
+            "C": "CC",
+            "G": "GG",
+            "T": "TT",
+            "R": "AG",
+            "Y": "CT",
+            "S": "GC",
+            "W": "AT",
+            "K": "GT",
+            "M": "AC",
+        }.items():
+            for pos, base in reversed(list(enumerate(pair))):
+                base_count[ord(code), "ACGT".index(base)] += 1
+                base_pos[ord(code), "ACGT".index(base)] = pos
+
+        # Per-site allele counts, and the first position of each allele in
+        # sample order (2 * sample + position in the pair).
+        per_sample = base_count[codes]
+        counts = per_sample.sum(axis=0, dtype=np.int64)
+        first_sample = (per_sample > 0).argmax(axis=0)
+        first_code = codes[first_sample, np.arange(codes.shape[1])[:, None]]
+        first_seen = np.where(
+            counts > 0,
+            2 * first_sample + base_pos[first_code, np.arange(4)],
+            2 * codes.shape[0],
+        )
+
+        num_alleles = np.count_nonzero(counts, axis=1)
+        ref = bases[np.lexsort((first_seen, -counts))[:, 0]]
+
+        is_homozygous = np.zeros(256, dtype=bool)
+        is_homozygous[bases] = True
+        is_missing = np.zeros(256, dtype=bool)
+        is_missing[np.frombuffer(b"N-?", dtype=np.uint8)] = True
+
+        encoded = np.ones(codes.shape, dtype=np.int8)
+        encoded[is_homozygous[codes] & (num_alleles >= 2)] = 2
+        encoded[codes == ref] = 0
+        encoded[is_missing[codes]] = -9
+
+        is_all_missing = np.all(codes == ord("N"), axis=0)
+        monomorphic_sites = np.flatnonzero((num_alleles < 2) & ~is_all_missing)
+        non_biallelic_sites = np.flatnonzero(
+            (num_alleles > 2) & ~is_all_missing
+        )
+
+        return (
+            encoded[:, ~is_all_missing],
+            monomorphic_sites.tolist(),
+            non_biallelic_sites.tolist(),
+            np.flatnonzero(is_all_missing).tolist(),
+        )
+
+    @staticmethod
+    def _encode_012_vcf(
+        snps: Union[np.ndarray, List[List[str]]]
+    ) -> Tuple[np.ndarray, List[int], List[int], List[int]]:
+        """Vectorized 012-encoding of VCF-style genotypes (e.g., "A/T"), one column per site.
+
+        The two most common alleles at each site (ties broken by first occurrence, as with ``sequence_tools.get_major_allele``) are the reference and alternate alleles. Alleles "-9", "-", "N", ".", and "?" are not counted. Homozygous reference genotypes are encoded as 0, any other homozygous allele as 2 (forcing multi-allelic sites to be bi-allelic), genotypes with a "-", "-9", or "N" allele as -9, and everything else as 1. Sites where every genotype is "N" are dropped.
+
+        Args:
+            snps (numpy.ndarray or List[List[str]]): Genotypes of shape (n_samples, n_sites).
+
+        Returns:
+            numpy.ndarray: 012-encoded int8 genotypes of shape (n_samples, n_retained_sites).
+            List[int]: Indices of monomorphic sites.
+            List[int]: Indices of sites with more than two alleles.
+            List[int]: Indices of sites with all missing data.
+        """
+        genotypes = np.asarray(snps, dtype=str)
+        n_samples, n_sites = genotypes.shape
+
+        # Split every genotype once and factorize the allele values.
+        parts = np.char.partition(genotypes, "/")
+        values, inverse = np.unique(
+            np.stack((parts[..., 0], parts[..., 2]), axis=1),
+            return_inverse=True,
+        )
+        # Alleles in sample order, shape (2 * n_samples, n_sites).
+        alleles = inverse.reshape(2 * n_samples, n_sites)
+        first, second = alleles[0::2], alleles[1::2]
+
+        # Per-site count and first occurrence of each counted allele value.
+        is_counted = ~np.isin(values, ["-9", "-", "N", ".", "?"])
+        counted = is_counted[alleles]
+        flat = (np.arange(n_sites) * len(values) + alleles)[counted]
+        counts = np.bincount(flat, minlength=n_sites * len(values))
+        first_seen = np.full(n_sites * len(values), alleles.shape[0])
+        position = np.broadcast_to(
+            np.arange(alleles.shape[0])[:, None], alleles.shape
+        )
+        np.minimum.at(first_seen, flat, position[counted])
+        counts = counts.reshape(n_sites, len(values))
+        first_seen = first_seen.reshape(n_sites, len(values))
+
+        num_alleles = np.count_nonzero(counts, axis=1)
+        ref = np.where(
+            num_alleles > 0, np.lexsort((first_seen, -counts))[:, 0], -1
+        )
+
+        encoded = np.ones((n_samples, n_sites), dtype=np.int8)
+        is_homozygous = (first == second) & is_counted[first]
+        encoded[is_homozygous & (num_alleles >= 2)] = 2
+        encoded[(first == ref) & (second == ref)] = 0
+        is_missing = np.isin(values, ["-", "-9", "N"])
+        encoded[is_missing[first] | is_missing[second]] = -9
+
+        is_all_missing = np.all(genotypes == "N", axis=0)
+        monomorphic_sites = np.flatnonzero((num_alleles < 2) & ~is_all_missing)
+        non_biallelic_sites = np.flatnonzero(
+            (num_alleles > 2) & ~is_all_missing
+        )
+
+        return (
+            encoded[:, ~is_all_missing],
+            monomorphic_sites.tolist(),
+            non_biallelic_sites.tolist(),
+            np.flatnonzero(is_all_missing).tolist(),
+        )
 
     def _convert_alleles(
         self,
@@ -2343,10 +2611,7 @@ class GenotypeData:
         if snp_data is None:
             snp_data = self.snp_data
 
-        snpsdict = {}
-        for ind, seq in zip(samples, snp_data):
-            snpsdict[ind] = seq
-        return snpsdict
+        return dict(zip(samples, snp_data))
 
     def _format_warning(
         self, message, category, filename, lineno, file=None, line=None
@@ -2373,6 +2638,58 @@ class GenotypeData:
         """
         return f"{filename}:{lineno}: {category.__name__}:{message}"
 
+    @staticmethod
+    def _encode_genotypes(
+        snp_data: Union[np.ndarray, List[List[Any]]],
+        encodings: Dict[Any, Any],
+        dtype,
+    ) -> np.ndarray:
+        """Map every genotype through an encoding dictionary with a single table lookup.
+
+        Single-character genotypes, including uint8 arrays of ASCII codes, index a 256-entry table built from ``encodings``. Any other values are factorized with ``np.unique`` and their encodings looked up once per distinct value.
+
+        Args:
+            snp_data (numpy.ndarray or List[List[Any]]): Genotypes of shape (n_samples, n_loci).
+
+            encodings (Dict[Any, Any]): Encoding for each genotype. Values may be scalars or equal-length sequences (e.g., one-hot vectors).
+
+            dtype (numpy.dtype): Data type of the encoded array.
+
+        Returns:
+            numpy.ndarray: Encoded genotypes of shape (n_samples, n_loci) plus the shape of the encoding values.
+
+        Raises:
+            KeyError: If a genotype is not in ``encodings``.
+        """
+        arr = np.asarray(snp_data)
+        single_char = all(
+            isinstance(k, str) and len(k) == 1 and ord(k) < 256
+            for k in encodings
+        )
+
+        if single_char and arr.dtype == np.uint8:
+            codes = arr
+        elif single_char and arr.dtype in (np.dtype("S1"), np.dtype("<U1")):
+            codes = arr.astype("S1").view(np.uint8)
+        else:
+            if arr.dtype == np.uint8:
+                arr = arr.view("S1").astype("U1")
+            values, inverse = np.unique(arr, return_inverse=True)
+            table = np.array([encodings[v] for v in values.tolist()], dtype)
+            return table[inverse.reshape(arr.shape)]
+
+        value_shape = np.shape(next(iter(encodings.values())))
+        table = np.zeros((256, *value_shape), dtype=dtype)
+        is_known = np.zeros(256, dtype=bool)
+        for k, v in encodings.items():
+            table[ord(k)] = v
+            is_known[ord(k)] = True
+
+        unknown = codes[~is_known[codes]]
+        if unknown.size:
+            raise KeyError(chr(unknown[0]))
+        return table[codes]
+
     def convert_onehot(
         self,
         snp_data: Union[np.ndarray, List[List[int]]],
@@ -2400,23 +2717,10 @@ class GenotypeData:
             If the data file type is "phylip" or "structure" and ``encodings_dict`` is not provided, a default encoding will be used. It is recommended to provide custom encodings for accurate conversion.
         """
 
-        if encodings_dict is None:
-            onehot_dict = get_onehot_dict()
-        else:
-            if isinstance(snp_data, np.ndarray):
-                snp_data = snp_data.tolist()
-            onehot_dict = encodings_dict
-        onehot_outer_list = list()
-
-        n_rows = len(self.samples) if encodings_dict is None else len(snp_data)
-
-        for i in range(n_rows):
-            onehot_list = list()
-            for j in range(len(snp_data[0])):
-                onehot_list.append(onehot_dict[snp_data[i][j]])
-            onehot_outer_list.append(onehot_list)
-
-        return np.array(onehot_outer_list)
+        onehot_dict = (
+            get_onehot_dict() if encodings_dict is None else encodings_dict
+        )
+        return self._encode_genotypes(snp_data, onehot_dict, float)
 
     def inverse_onehot(
         self,
@@ -2436,24 +2740,20 @@ class GenotypeData:
             get_onehot_dict() if encodings_dict is None else encodings_dict
         )
 
-        # Create inverse dictionary (from list to key)
-        inverse_onehot_dict = {tuple(v): k for k, v in onehot_dict.items()}
-
-        if isinstance(onehot_data, np.ndarray):
-            onehot_data = onehot_data.tolist()
+        onehot_data = np.asarray(onehot_data)
+        keys = list(onehot_dict.keys())
 
-        decoded_outer_list = []
+        # Match every one-hot vector against each encoding in one pass per
+        # key. As with a reverse dictionary lookup, later keys win when two
+        # keys share an encoding.
+        index = np.full(onehot_data.shape[:-1], -1, dtype=np.intp)
+        for i, vector in enumerate(onehot_dict.values()):
+            index[np.all(onehot_data == np.asarray(vector), axis=-1)] = i
 
-        for i in range(len(onehot_data)):
-            decoded_list = []
-            for j in range(len(onehot_data[0])):
-                # Look up original key using one-hot encoded list
-                decoded_list.append(
-                    inverse_onehot_dict[tuple(onehot_data[i][j])]
-                )
-            decoded_outer_list.append(decoded_list)
+        if np.any(index < 0):
+            raise KeyError(tuple(onehot_data[index < 0][0].tolist()))
 
-        return np.array(decoded_outer_list)
+        return np.array(keys)[index]
 
     def convert_int_iupac(
         self,
@@ -2478,27 +2778,13 @@ class GenotypeData:
             Otherwise, if `encodings_dict` is provided, it will be used for conversion.
         """
 
-        if encodings_dict is None:
-            int_iupac_dict = get_int_iupac_dict()
-        else:
-            if isinstance(snp_data, np.ndarray):
-                snp_data = snp_data.tolist()
-
-            int_iupac_dict = encodings_dict
-
-        outer_list = list()
-
-        n_rows = (
-            len(self._samples) if encodings_dict is None else len(snp_data)
+        int_iupac_dict = (
+            get_int_iupac_dict() if encodings_dict is None else encodings_dict
+        )
+        return np.asarray(
+            self._encode_genotypes(snp_data, int_iupac_dict, np.int8),
+            order=self._layout,
         )
-
-        for i in range(n_rows):
-            int_iupac = list()
-            for j in range(len(snp_data[0])):
-                int_iupac.append(int_iupac_dict[snp_data[i][j]])
-            outer_list.append(int_iupac)
-
-        return np.array(outer_list)
 
     def inverse_int_iupac(
         self,
@@ -2523,21 +2809,14 @@ class GenotypeData:
             v: k for k, v in int_encodings_dict.items()
         }
 
-        if isinstance(int_encoded_data, np.ndarray):
-            int_encoded_data = int_encoded_data.tolist()
-
-        decoded_outer_list = []
-
-        for i in range(len(int_encoded_data)):
-            decoded_list = []
-            for j in range(len(int_encoded_data[0])):
-                # Look up original key using integer encoding
-                decoded_list.append(
-                    inverse_int_encodings_dict[int_encoded_data[i][j]]
-                )
-            decoded_outer_list.append(decoded_list)
-
-        return np.array(decoded_outer_list)
+        # Look up each distinct code once and gather the keys back into
+        # the input shape.
+        arr = np.asarray(int_encoded_data)
+        values, inverse = np.unique(arr, return_inverse=True)
+        table = np.array(
+            [inverse_int_encodings_dict[v] for v in values.tolist()]
+        )
+        return table[inverse.reshape(arr.shape)]
 
     def read_popmap(self, popmapfile: Optional[str]) -> None:
         """
@@ -2606,25 +2885,33 @@ class GenotypeData:
                     f"({len(self.samples)})\n"
                 )
 
-            for sample in samples:
-                if sample in my_popmap.popmap:
-                    self._populations.append(my_popmap.popmap[sample])
+            populations = pd.Series(samples, dtype=object).map(
+                my_popmap.popmap
+            )
+            self._populations.extend(populations.dropna().tolist())
         else:
-            popmap_keys_set = set(my_popmap.popmap.keys())
-            new_samples = [x for x in samples if x in popmap_keys_set]
+            sample_arr = np.asarray(samples, dtype=object)
+            popmap_keys = np.fromiter(
+                my_popmap.popmap.keys(),
+                dtype=object,
+                count=len(my_popmap.popmap),
+            )
+            popmap_values = np.fromiter(
+                my_popmap.popmap.values(),
+                dtype=object,
+                count=len(my_popmap.popmap),
+            )
 
-            new_samples_set = set(new_samples)
-            new_populations = [
-                p for s, p in my_popmap.popmap.items() if s in new_samples_set
-            ]
+            new_samples = sample_arr[np.isin(sample_arr, popmap_keys)]
+            new_populations = popmap_values[np.isin(popmap_keys, new_samples)]
 
-            if not new_samples:
+            if new_samples.size == 0:
                 raise ValueError(
                     "No samples in the popmap file were found in the alignment file."
                 )
 
-            self._samples = new_samples
-            self._populations = new_populations
+            self._samples = new_samples.tolist()
+            self._populations = new_populations.tolist()
 
         self._popmap = my_popmap.popmap
         self._popmap_inverse = my_popmap.popmap_flipped
@@ -2679,26 +2966,6 @@ class GenotypeData:
         elif isinstance(X, (np.ndarray, list)):
             df = pd.DataFrame(X)
 
-        nuc = {
-            "A/A": "A",
-            "T/T": "T",
-            "G/G": "G",
-            "C/C": "C",
-            "A/G": "R",
-            "G/A": "R",
-            "C/T": "Y",
-            "T/C": "Y",
-            "G/C": "S",
-            "C/G": "S",
-            "A/T": "W",
-            "T/A": "W",
-            "G/T": "K",
-            "T/G": "K",
-            "A/C": "M",
-            "C/A": "M",
-            "N/N": "N",
-        }
-
         ft = self.filetype.lower()
 
         is_phylip = False
@@ -2733,9 +3000,13 @@ class GenotypeData:
             d.update(dstr)
             dreplace = {col: d for col in list(df.columns)}
 
+            df_decoded.replace(dreplace, inplace=True)
+
         else:
-            dreplace = dict()
-            for col, ref, alt in zip(df.columns, self._ref, self._alt):
+            # Decoded genotypes for 0, 1, 2, and -9, one row per locus.
+            n_loci = min(len(self._ref), len(self._alt))
+            lut = np.empty((n_loci, 4), dtype=object)
+            for i, (ref, alt) in enumerate(zip(self._ref, self._alt)):
                 # if site is monomorphic, set alt and ref state the same
                 if alt is None:
                     alt = ref
@@ -2744,23 +3015,27 @@ class GenotypeData:
                 het2 = f"{ref}/{alt}"
 
                 if is_phylip:
-                    ref2 = nuc[ref2]
-                    alt2 = nuc[alt2]
-                    het2 = nuc[het2]
-
-                d = {
-                    "0": ref2,
-                    0: ref2,
-                    "1": het2,
-                    1: het2,
-                    "2": alt2,
-                    2: alt2,
-                    "-9": "N",
-                    -9: "N",
-                }
-                dreplace[col] = d
-
-        df_decoded.replace(dreplace, inplace=True)
+                    ref2 = self._DIPLOID_IUPAC[ref2]
+                    alt2 = self._DIPLOID_IUPAC[alt2]
+                    het2 = self._DIPLOID_IUPAC[het2]
+
+                lut[i] = (ref2, het2, alt2, "N")
+
+            # Gather every cell from its locus' row. Values other than
+            # 0, 1, 2, and -9 (or their string forms) are left unchanged.
+            values = df_decoded.to_numpy()
+            n_loci = min(values.shape[1], n_loci)
+            encoded = values[:, :n_loci]
+            index = np.full(encoded.shape, -1, dtype=np.int8)
+            for k, code in enumerate((0, 1, 2, -9)):
+                index[(encoded == code) | (encoded == str(code))] = k
+
+            values[:, :n_loci] = np.where(
+                index >= 0, lut[np.arange(n_loci), index], encoded
+            )
+            df_decoded = pd.DataFrame(
+                values, index=df.index, columns=df.columns
+            )
 
         if write_output:
             outfile = os.path.join(
@@ -2768,52 +3043,51 @@ class GenotypeData:
             )
 
         if ft.startswith("structure"):
-            if ft.startswith("structure2row"):
-                for col in df_decoded.columns:
-                    df_decoded[col] = (
-                        df_decoded[col]
-                        .str.split("/")
-                        .apply(lambda x: list(map(int, x)))
-                    )
-
-                df_decoded.insert(0, "sampleID", self._samples)
-                df_decoded.insert(1, "popID", self._populations)
-
-                # Transform each element to a separate row.
-                df_decoded = (
-                    df_decoded.set_index(["sampleID", "popID"])
-                    .apply(pd.Series.explode)
-                    .reset_index()
+            if ft.startswith("structure2row") or ft == "structure":
+                # Split every genotype once and write each sample's two
+                # alleles as consecutive rows.
+                parts = np.char.partition(df_decoded.to_numpy(dtype=str), "/")
+                alleles = np.stack(
+                    (parts[..., 0], parts[..., 2]), axis=1
+                ).astype(int)
+
+                df_decoded = pd.DataFrame(
+                    alleles.reshape(-1, alleles.shape[-1]),
+                    columns=df_decoded.columns,
+                )
+                df_decoded.insert(0, "sampleID", np.repeat(self._samples, 2))
+                df_decoded.insert(
+                    1, "popID", np.repeat(self._populations, 2)
                 )
 
             elif ft.startswith("structure1row"):
-                df_decoded = pd.concat(
-                    [
-                        df_decoded[c]
-                        .astype(str)
-                        .str.split("/", expand=True)
-                        .add_prefix(f"{c}_")
-                        for c in df_decoded.columns
-                    ],
+                # Split every genotype once. Genotypes without a "/" have
+                # no second allele, and a locus where none has one gets no
+                # second column.
+                parts = np.char.partition(df_decoded.to_numpy(dtype=str), "/")
+                has_second = parts[..., 1] == "/"
+                alleles = np.stack(
+                    (
+                        parts[..., 0].astype(object),
+                        np.where(has_second, parts[..., 2], None),
+                    ),
+                    axis=2,
+                ).reshape(len(df_decoded), -1)
+
+                keep = np.stack(
+                    (
+                        np.ones(parts.shape[1], dtype=bool),
+                        has_second.any(axis=0),
+                    ),
                     axis=1,
-                )
-
-            elif ft == "structure":
-                for col in df_decoded.columns:
-                    df_decoded[col] = (
-                        df_decoded[col]
-                        .str.split("/")
-                        .apply(lambda x: list(map(int, x)))
-                    )
-
-                df_decoded.insert(0, "sampleID", self._samples)
-                df_decoded.insert(1, "popID", self._populations)
-
-                # Transform each element to a separate row.
-                df_decoded = (
-                    df_decoded.set_index(["sampleID", "popID"])
-                    .apply(pd.Series.explode)
-                    .reset_index()
+                ).ravel()
+                columns = [
+                    f"{c}_{i}" for c in df_decoded.columns for i in (0, 1)
+                ]
+                df_decoded = pd.DataFrame(
+                    alleles[:, keep],
+                    index=df_decoded.index,
+                    columns=np.array(columns, dtype=object)[keep],
                 )
 
             if write_output:
@@ -2832,15 +3106,27 @@ class GenotypeData:
             if write_output:
                 of = f"{outfile}.phy"
                 header = f"{self.num_inds} {self.num_snps}\n"
-                with open(of, "w") as fout:
-                    fout.write(header)
 
-                lst_decoded = df_decoded.values.tolist()
+                # Single-character genotypes are joined into one string
+                # per sample by viewing each row as a single string.
+                chars = np.ascontiguousarray(df_decoded.to_numpy(dtype=str))
+                if chars.dtype == np.dtype("<U1") and chars.shape[1]:
+                    seqs = chars.view(f"<U{chars.shape[1]}").ravel()
+                else:
+                    seqs = ["".join(row) for row in chars]
+
+                df_seqs = pd.DataFrame(
+                    {"sampleID": self._samples, "seq": seqs}
+                )
 
-                with open(of, "a") as fout:
-                    for sample, row in zip(self._samples, lst_decoded):
-                        seqs = "".join([str(x) for x in row])
-                        fout.write(f"{sample}\t{seqs}\n")
+                with open(of, "w") as fout:
+                    fout.write(header)
+                    df_seqs.to_csv(
+                        fout,
+                        sep="\t",
+                        header=False,
+                        index=False,
+                    )
 
         if write_output:
             return of
@@ -3021,6 +3307,9 @@ class GenotypeData:
         Path(outdir).mkdir(exist_ok=True, parents=True)
         outfile = os.path.join(outdir, fname)
 
+        loci_indices = self._as_indices(loci_indices)
+        sample_indices = self._as_indices(sample_indices)
+
         with h5py.File(outfile, "w") as filtered_file:
             with h5py.File(vcf_attributes_path, "r") as original_file:
                 # Iterate through each attribute key and subset the data
@@ -3038,21 +3327,20 @@ class GenotypeData:
                         # Process in chunks
                         for start in range(0, len(loci_indices), chunk_size):
                             end = min(start + chunk_size, len(loci_indices))
-                            loci_chunk = loci_indices[start:end]
-                            data_chunk = original_file[key][loci_chunk]
-                            filtered_dataset[start:end] = data_chunk
+                            filtered_dataset[start:end] = self._read_rows(
+                                original_file[key], loci_indices[start:end]
+                            )
                     else:
                         # Handling "info" and "calldata" groups
                         filtered_group = filtered_file.create_group(key)
                         for inner_key in original_file[key].keys():
-                            original_shape = original_file[
-                                f"{key}/{inner_key}"
-                            ].shape
-                            dtype = original_file[f"{key}/{inner_key}"].dtype
+                            original = original_file[f"{key}/{inner_key}"]
+                            original_shape = original.shape
+                            dtype = original.dtype
                             filtered_shape = list(original_shape)
-                            if len(original_shape) > 0:
+                            if original.ndim > 0:
                                 filtered_shape[0] = len(loci_indices)
-                            if len(original_shape) > 1:
+                            if original.ndim > 1:
                                 filtered_shape[1] = len(sample_indices)
                             filtered_dataset = filtered_group.create_dataset(
                                 inner_key,
@@ -3060,6 +3348,14 @@ class GenotypeData:
                                 dtype=dtype,
                             )  # Create dataset for each inner_key
 
+                            # Skip the sample gather when every sample is
+                            # kept in order.
+                            columns = None
+                            if original.ndim > 1 and not np.array_equal(
+                                sample_indices, np.arange(original.shape[1])
+                            ):
+                                columns = sample_indices
+
                             # Process in chunks
                             for start in range(
                                 0, len(loci_indices), chunk_size
@@ -3067,24 +3363,58 @@ class GenotypeData:
                                 end = min(
                                     start + chunk_size, len(loci_indices)
                                 )
-                                loci_chunk = loci_indices[start:end]
-
-                                if len(original_shape) == 1:
-                                    data_chunk = original_file[
-                                        f"{key}/{inner_key}"
-                                    ][loci_chunk]
-                                else:  # len(original_shape) == 2, so key must be "calldata" or "snp_data"
-                                    data_chunk = original_file[
-                                        f"{key}/{inner_key}"
-                                    ][loci_chunk, :][:, sample_indices]
-                                filtered_dataset[start:end] = (
-                                    data_chunk
-                                    if len(filtered_shape) == 1
-                                    else data_chunk[:, :]
+                                filtered_dataset[start:end] = self._read_rows(
+                                    original, loci_indices[start:end], columns
                                 )
 
         return outfile
 
+    @staticmethod
+    def _read_rows(
+        dataset: h5py.Dataset,
+        rows: np.ndarray,
+        columns: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Read rows (and optionally columns) of an HDF5 dataset by index.
+
+        h5py selects a list of indices one hyperslab at a time, which is slow for many rows. When the requested rows are dense, the contiguous block spanning them is read in one go and the rows are then selected with NumPy. Columns are gathered in a second pass along axis 1, which is several times faster than a combined ``np.ix_`` selection.
+
+        Args:
+            dataset (h5py.Dataset): Dataset to read from.
+
+            rows (numpy.ndarray): Non-empty, strictly increasing row indices to read.
+
+            columns (numpy.ndarray, optional): Column indices to select along axis 1. If None, all columns are kept. Defaults to None.
+
+        Returns:
+            numpy.ndarray: The selected rows (and columns) of ``dataset``\.
+        """
+        start, stop = rows[0], rows[-1] + 1
+        if stop - start == len(rows):
+            # Consecutive rows need no gather.
+            block = dataset[start:stop]
+        elif stop - start > 4 * len(rows):
+            block = dataset[rows]
+        else:
+            block = dataset[start:stop][rows - start]
+        # take() avoids the slow fancy-indexing path along a middle axis.
+        return block if columns is None else block.take(columns, axis=1)
+
+    @staticmethod
+    def _as_indices(selection) -> np.ndarray:
+        """Convert a boolean mask or a sequence of indices to an index array.
+
+        Args:
+            selection (Union[numpy.ndarray, List[int], List[bool], range]): Boolean mask or integer indices.
+
+        Returns:
+            numpy.ndarray: Integer indices (int64) of the selected elements.
+        """
+        selection = np.asarray(selection)
+        if selection.dtype == bool:
+            return np.flatnonzero(selection)
+        return selection.astype(np.int64, copy=False)
+
     def _genotype_to_iupac(self, genotype: str) -> str:
         """
         Convert a genotype string to its corresponding IUPAC code.
@@ -3095,20 +3425,7 @@ class GenotypeData:
         Returns:
             str: Corresponding IUPAC code for the input genotype. Returns 'N' if the genotype is not in the lookup dictionary.
         """
-        iupac_dict = {
-            "0/0": "A",
-            "1/1": "T",
-            "2/2": "C",
-            "3/3": "G",
-            "0/1": "W",
-            "0/2": "M",
-            "0/3": "R",
-            "1/2": "Y",
-            "1/3": "K",
-            "2/3": "S",
-            "-9/-9": "N",
-        }
-        return iupac_dict.get(genotype, "N")
+        return self._GENOTYPE_IUPAC.get(genotype, "N")
 
     def _iupac_to_genotype(self, iupac_code: str) -> str:
         """
@@ -3120,23 +3437,13 @@ class GenotypeData:
         Returns:
             str: Corresponding genotype string for the input IUPAC code. Returns '-9/-9' if the IUPAC code is not in the lookup dictionary.
         """
-        genotype_dict = {
-            "A": "0/0",
-            "T": "1/1",
-            "C": "2/2",
-            "G": "3/3",
-            "W": "0/1",
-            "M": "0/2",
-            "R": "0/3",
-            "Y": "1/2",
-            "K": "1/3",
-            "S": "2/3",
-            "N": "-9/-9",
-        }
-        return genotype_dict.get(iupac_code, "-9/-9")
+        return self._IUPAC_GENOTYPES.get(iupac_code, "-9/-9")
 
     def calc_missing(
-        self, df: pd.DataFrame, use_pops: bool = True
+        self,
+        df: pd.DataFrame,
+        use_pops: bool = True,
+        round_output: bool = True,
     ) -> Tuple[
         pd.Series,
         pd.Series,
@@ -3152,6 +3459,8 @@ class GenotypeData:
 
             use_pops (bool, optional): If True, calculate statistics per population. Defaults to True.
 
+            round_output (bool, optional): If True, round the missing value proportions to two decimals for display. Set to False to get the unrounded proportions. Defaults to True.
+
         Returns:
             Tuple[pd.Series, pd.Series, Optional[pd.DataFrame], Optional[pd.Series], Optional[pd.DataFrame]]: A tuple of missing value statistics:
 
@@ -3165,27 +3474,46 @@ class GenotypeData:
 
             - indpop (Optional[pd.DataFrame]): Missing value proportions per individual and population. Only returned if use_pops=True.
         """
+        # Compute the missing-value mask once and reduce it along each axis.
+        mask = df.isna().to_numpy()
+        num_inds = self.num_inds
+        num_snps = self.num_snps
+
         # Get missing value counts per-locus.
-        loc = df.isna().sum(axis=0) / self.num_inds
-        loc = loc.round(2)
+        loc = pd.Series(mask.sum(axis=0) / num_inds, index=df.columns)
 
         # Get missing value counts per-individual.
-        ind = df.isna().sum(axis=1) / self.num_snps
-        ind = ind.round(2)
+        ind = pd.Series(mask.sum(axis=1) / num_snps, index=df.index)
 
         poploc = None
         poptot = None
         indpop = None
         if use_pops:
-            popdf = df.copy()
-            popdf.index = self._populations
-            misscnt = popdf.isna().groupby(level=0).sum()
-            n = popdf.groupby(level=0).size()
-            poploc = misscnt.div(n, axis=0).round(2).T
-            poptot = misscnt.sum(axis=1) / self.num_snps
-            poptot = poptot.div(n, axis=0).round(2)
+            # Sort individuals by population and sum each population's
+            # contiguous block of rows.
+            pops, inverse = np.unique(
+                np.asarray(self._populations), return_inverse=True
+            )
+            order = np.argsort(inverse, kind="stable")
+            n = np.bincount(inverse)
+            misscnt = np.add.reduceat(
+                mask[order], np.cumsum(n) - n, axis=0, dtype=np.int64
+            )
+
+            poploc = pd.DataFrame(
+                misscnt / n[:, None], index=pops, columns=df.columns
+            ).T
+            poptot = misscnt.sum(axis=1) / num_snps
+            poptot = pd.Series(poptot / n, index=pops)
             indpop = df.copy()
 
+        if round_output:
+            loc = loc.round(2)
+            ind = ind.round(2)
+            if use_pops:
+                poploc = poploc.round(2)
+                poptot = poptot.round(2)
+
         return loc, ind, poploc, poptot, indpop
 
     def calculate_hs_ht(self, snp_data, populations):
@@ -3270,6 +3598,50 @@ class GenotypeData:
         return HsHt
         
 
+    # Derived data rebuilt on demand; dropped from pickled state.
+    _TRANSIENT_ATTRS: ClassVar[Tuple[str, ...]] = (
+        "_cache_012",
+        "_cache_snpsdict",
+        "_cache_site_rates",
+        "_fmt012",
+        "_snpsdict",
+    )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the picklable state of the GenotypeData object.
+
+        The derived caches are omitted so that they are rebuilt lazily after unpickling instead of being serialized alongside ``snp_data``\. The ``pysam.VariantHeader`` cannot be pickled, so it is stored as its header text.
+
+        Returns:
+            Dict[str, Any]: State dictionary for pickling.
+        """
+        state = {
+            k: v
+            for k, v in self.__dict__.items()
+            if k not in self._TRANSIENT_ATTRS
+        }
+        if state.get("vcf_header") is not None:
+            state["vcf_header"] = str(state["vcf_header"])
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the GenotypeData object from its pickled state.
+
+        Args:
+            state (Dict[str, Any]): State dictionary from ``__getstate__``\.
+        """
+        self.__dict__.update(state)
+        for name in self._TRANSIENT_ATTRS:
+            self.__dict__.setdefault(name, None)
+
+        header = self.__dict__.get("vcf_header")
+        if isinstance(header, str):
+            with tempfile.NamedTemporaryFile("w", suffix=".vcf") as tmp:
+                tmp.write(header)
+                tmp.flush()
+                with VariantFile(tmp.name) as vcf:
+                    self.vcf_header = vcf.header.copy()
+
     def copy(self):
         """Create a deep copy of the GenotypeData object.
 
@@ -3282,9 +3654,12 @@ class GenotypeData:
         # Shallow copy of the original object's __dict__
         new_obj.__dict__.update(self.__dict__)
 
-        # Deep copy all attributes EXCEPT the problematic VariantHeader
+        # Deep copy all attributes EXCEPT the problematic VariantHeader.
+        # Derived caches are left to be rebuilt for the copy.
         for name, attr in self.__dict__.items():
-            if name != "vcf_header":
+            if name in self._TRANSIENT_ATTRS:
+                setattr(new_obj, name, None)
+            elif name != "vcf_header":
                 setattr(new_obj, name, copy.deepcopy(attr))
 
         # Explicitly copy VariantHeader
@@ -3308,6 +3683,31 @@ class GenotypeData:
             self.instance = instance
             self.is_structure = is_structure
 
+        def _encoded(self) -> np.ndarray:
+            """Return the 012-encoded genotypes, encoding them only when ``snp_data`` has changed.
+
+            The encoded array is cached on the GenotypeData instance together with the ``snp_data`` array it was computed from, so requesting several formats encodes the genotypes once. Callers must copy the array before handing it out.
+
+            Returns:
+                numpy.ndarray: Cached 012-encoded int8 genotypes of shape (n_samples, n_retained_sites).
+            """
+            instance = self.instance
+            cache = getattr(instance, "_cache_012", None)
+            if (
+                cache is None
+                or cache[0] is not instance._snp_data
+                or cache[1] != self.is_structure
+            ):
+                encoded = np.asarray(
+                    instance._convert_012_array(
+                        instance._snp_data.view("S1"), vcf=self.is_structure
+                    ),
+                    order=instance._layout,
+                )
+                cache = (instance._snp_data, self.is_structure, encoded)
+                instance._cache_012 = cache
+            return cache[2]
+
         def __call__(self, fmt="list"):
             """
             Convert genotype data in 012 format to the specified output format.
@@ -3322,31 +3722,32 @@ class GenotypeData:
                 ValueError: Invalid format supplied.
             """
             if fmt == "list":
-                return list(
-                    self.instance.convert_012(
-                        self.instance.snp_data, vcf=self.is_structure
-                    )
-                )
+                return self._encoded().tolist()
 
             elif fmt == "numpy":
-                return np.array(
-                    self.instance.convert_012(
-                        self.instance.snp_data, vcf=self.is_structure
-                    )
-                )
+                return self._encoded().copy(order="K")
 
             elif fmt == "pandas":
-                return pd.DataFrame.from_records(
-                    self.instance.convert_012(
-                        self.instance.snp_data, vcf=self.is_structure
-                    )
-                )
+                # A column-major array is kept as-is by pandas' blocks.
+                encoded = self._encoded().copy(order="K")
+                return pd.DataFrame(encoded, copy=False)
 
             else:
                 raise ValueError(
                     "Invalid format. Supported formats: 'list', 'numpy', 'pandas'"
                 )
 
+    @classmethod
+    def enable_profiling(cls) -> None:
+        """Wrap the public methods of GenotypeData with performance measurement.
+
+        Profiling is off by default so that tight loops over cheap methods do not pay for the CPU, memory, and timing bookkeeping. Calling this method (or passing ``measure=True`` to the constructor) applies ``class_performance_decorator`` at runtime; results are collected in ``resource_data`` and can be plotted with ``plot_performance()``. Profiling stays enabled for the rest of the session.
+        """
+        if cls._profiling_enabled:
+            return
+        class_performance_decorator(measure=True)(cls)
+        cls._profiling_enabled = True
+
     @classmethod
     def plot_performance(cls, fontsize=14, color="#8C56E3", figsize=(16, 9)):
         """Plots the performance metrics: CPU Load, Memory Footprint, and Execution Time.
@@ -3378,6 +3779,11 @@ class GenotypeData:
             plot_dir=plot_dir,
         )
 
+    @property
+    def _kwargs(self) -> Dict[str, Any]:
+        """GenotypeData keyword arguments, built from the current attribute values."""
+        return {k: getattr(self, k) for k in self._PARAM_NAMES}
+
     @property
     def inputs(self):
         """Get GenotypeData keyword arguments as a dictionary."""
@@ -3386,7 +3792,8 @@ class GenotypeData:
     @inputs.setter
     def inputs(self, value):
         """Setter method for class keyword arguments."""
-        self._kwargs = value
+        for k, v in value.items():
+            setattr(self, k, v)
 
     @property
     def num_snps(self) -> int:
@@ -3395,7 +3802,7 @@ class GenotypeData:
         Returns:
             int: Number of SNPs per individual.
         """
-        return len(self._snp_data[0])
+        return self._snp_data.shape[1]
 
     @property
     def num_inds(self) -> int:
@@ -3404,7 +3811,7 @@ class GenotypeData:
         Returns:
             int: Number of individuals in input data.
         """
-        return len(self._snp_data)
+        return self._snp_data.shape[0]
 
     @property
     def populations(self) -> List[Union[str, int]]:
@@ -3470,36 +3877,45 @@ class GenotypeData:
     def snpsdict(self) -> Dict[str, List[str]]:
         """
         Dictionary with Sample IDs as keys and lists of genotypes as values.
+
+        The dictionary is only rebuilt after ``snp_data`` or ``samples`` have been replaced.
         """
-        self._snpsdict = self._make_snpsdict()
+        cache = getattr(self, "_cache_snpsdict", None)
+        if (
+            cache is None
+            or cache[0] is not self._snp_data
+            or cache[1] is not self._samples
+        ):
+            self._snpsdict = self._make_snpsdict()
+            self._cache_snpsdict = (self._snp_data, self._samples)
         return self._snpsdict
 
     @snpsdict.setter
     def snpsdict(self, value):
         """Set snpsdict object, which is a dictionary with sample IDs as keys and lists of genotypes as values."""
         self._snpsdict = value
+        self._cache_snpsdict = (self._snp_data, self._samples)
 
     @property
     def snp_data(self) -> List[List[str]]:
-        """Get the genotypes as a 2D list of shape (n_samples, n_loci)."""
-        return self._snp_data
+        """Get the genotypes as a 2D list of shape (n_samples, n_loci).
+
+        Genotypes are stored internally as a uint8 array of ASCII IUPAC codes, so a new list is built on each access.
+        """
+        return self._snp_chars.tolist()
 
     @snp_data.setter
     def snp_data(self, value) -> None:
         """Set snp_data. Input can be a 2D list, numpy array, pandas DataFrame, or MultipleSeqAlignment object."""
-        if not isinstance(value, list):
-            if isinstance(value, np.ndarray):
-                value = value.tolist()
-            elif isinstance(value, pd.DataFrame):
-                value = value.values.tolist()
-            elif isinstance(value, MultipleSeqAlignment):
-                value = [list(str(record.seq)) for record in value]
-            else:
-                raise TypeError(
-                    f"snp_data must be a list, numpy array, pandas dataframe, or MultipleSeqAlignment, but got {type(value)}"
-                )
-        self._snp_data = value
-        self._validate_seq_lengths()
+        if not isinstance(
+            value, (list, np.ndarray, pd.DataFrame, MultipleSeqAlignment)
+        ):
+            raise TypeError(
+                f"snp_data must be a list, numpy array, pandas dataframe, or MultipleSeqAlignment, but got {type(value)}"
+            )
+        if isinstance(value, list):
+            self._validate_seq_lengths(value)
+        self._snp_data = self._as_codes(value)
 
     @property
     def genotypes_012(
@@ -3523,8 +3939,12 @@ class GenotypeData:
             >>>gt_df = GenotypeData.genotypes_012(fmt="pandas")
         """
         # TODO: Remove deprecated 'vcf' and 'is_structure' arguments.
-        # # is_str = True if self.filetype.startswith("structure") else False
-        return self._DataFormat012(self, is_structure=False)
+        fmt012 = getattr(self, "_fmt012", None)
+        if fmt012 is None:
+            fmt012 = self._fmt012 = self._DataFormat012(
+                self, is_structure=False
+            )
+        return fmt012
 
     @genotypes_012.setter
     def genotypes_012(self, value) -> List[List[int]]:
@@ -3533,7 +3953,9 @@ class GenotypeData:
         Args:
             value (np.ndarray): 2D numpy array with 012-encoded genotypes.
         """
-        self._snp_data = self.decode_012(value, write_output=False)
+        self._snp_data = self._as_codes(
+            self.decode_012(value, write_output=False)
+        )
 
     @property
     def genotypes_onehot(self) -> Union[np.ndarray, List[List[List[float]]]]:
@@ -3559,7 +3981,7 @@ class GenotypeData:
             )
 
         Xt = self.inverse_onehot(X)
-        self._snp_data = Xt.tolist()
+        self._snp_data = self._as_codes(Xt)
 
     @property
     def genotypes_int(self) -> np.ndarray:
@@ -3588,7 +4010,7 @@ class GenotypeData:
             )
 
         Xt = self.inverse_int_iupac(X)
-        self._snp_data = Xt.tolist()
+        self._snp_data = self._as_codes(Xt)
 
     @property
     def alignment(self) -> List[MultipleSeqAlignment]:
@@ -3598,7 +4020,7 @@ class GenotypeData:
         """
         return MultipleSeqAlignment(
             [
-                SeqRecord(Seq("".join(row)), id=sample)
+                SeqRecord(Seq(row.tobytes().decode("ascii")), id=sample)
                 for sample, row in zip(self._samples, self._snp_data)
             ]
         )
@@ -3616,23 +4038,31 @@ class GenotypeData:
         Raises:
             TypeError: If the input value is not a MultipleSeqAlignment object, list, numpy array, or pandas DataFrame.
         """
-        if isinstance(value, MultipleSeqAlignment):
-            alignment_array = np.array(
-                [list(str(record.seq)) for record in value]
-            )
-        elif isinstance(value, pd.DataFrame):
-            # Convert list, numpy array, or pandas DataFrame to list
-            alignment_array = value.values.tolist()
-        elif isinstance(value, np.ndarray):
-            alignment_array = value.tolist()
-        elif isinstance(value, list):
-            alignment_array = value
-        else:
+        if not isinstance(
+            value, (MultipleSeqAlignment, pd.DataFrame, np.ndarray, list)
+        ):
             raise TypeError(
                 "alignment must be a MultipleSequenceAlignment object, list, numpy array, or pandas DataFrame."
             )
 
-        self._snp_data = alignment_array
+        self._snp_data = self._as_codes(value)
+
+    def to_fasta_bytes(self) -> bytes:
+        """Get the alignment as FASTA-formatted bytes.
+
+        The sequences are copied directly from the ``snp_data`` rows without building a ``MultipleSeqAlignment``, so this is the cheaper option when only the FASTA text is needed.
+
+        Returns:
+            bytes: FASTA records with one ``>sample`` header and one sequence line per sample.
+        """
+        buf = bytearray()
+        for sample, row in zip(self._samples, self._snp_data):
+            buf += b">"
+            buf += str(sample).encode()
+            buf += b"\n"
+            buf += row.tobytes()
+            buf += b"\n"
+        return bytes(buf)
 
     @property
     def vcf_attributes(self) -> str:
@@ -3688,12 +4118,15 @@ class GenotypeData:
 
         """
         self._sample_indices = value
-        self._samples = [x for i, x in enumerate(self._samples) if i in value]
-        self._populations = [
-            p
-            for i, (s, p) in zip(self._samples, self._populations)
-            if s in value
-        ]
+
+        keep = np.zeros(len(self._samples), dtype=bool)
+        keep[np.asarray(value, dtype=int)] = True
+
+        self._samples = np.asarray(self._samples, dtype=object)[keep].tolist()
+        if len(self._populations) == keep.size:
+            self._populations = np.asarray(self._populations, dtype=object)[
+                keep
+            ].tolist()
 
     @property
     def ref(self) -> List[str]:
@@ -3739,29 +4172,39 @@ class GenotypeData:
 
     @property
     def site_rates(self):
-        """Get site rate data for phylogenetic tree."""
-        if self.siterates_iqtree is not None and self.siterates is None:
-            self._site_rates = self.siterates_from_iqtree(
-                self.siterates_iqtree
-            )
-            self._validate_rates()
-        elif self.siterates_iqtree is None and self.siterates is not None:
-            self._site_rates = self.siterates_from_file(self.siterates)
-            self._validate_rates()
-        elif (
-            self.siterates_iqtree is None
-            and self.siterates is None
-            and self._site_rates is None
+        """Get site rate data for phylogenetic tree.
+
+        Rates are read from file on first access. The rates at the retained ``loci_indices`` are only recomputed after the rates or ``loci_indices`` have been replaced.
+        """
+        if self._site_rates is None:
+            if self.siterates_iqtree is not None and self.siterates is None:
+                self._site_rates = self.siterates_from_iqtree(
+                    self.siterates_iqtree
+                )
+                self._validate_rates()
+            elif self.siterates_iqtree is None and self.siterates is not None:
+                self._site_rates = self.siterates_from_file(self.siterates)
+                self._validate_rates()
+            else:
+                raise TypeError(
+                    "siterates or siterates_iqtree must be provided at class instantiation or the site_rates property must be set to get the site_rates object."
+                )
+
+        cache = getattr(self, "_cache_site_rates", None)
+        if (
+            cache is None
+            or cache[0] is not self._site_rates
+            or cache[1] is not self.loci_indices
         ):
-            raise TypeError(
-                "siterates or siterates_iqtree must be provided at class instantiation or the site_rates property must be set to get the site_rates object."
-            )
-        self._site_rates = [
-            self._site_rates[i]
-            for i in range(len(self._site_rates))
-            if i in self.loci_indices
-        ]
-        return self._site_rates
+            keep = np.isin(np.arange(len(self._site_rates)), self.loci_indices)
+            rates = [
+                rate
+                for rate, is_kept in zip(self._site_rates, keep)
+                if is_kept
+            ]
+            cache = (self._site_rates, self.loci_indices, rates)
+            self._cache_site_rates = cache
+        return cache[2]
 
     @site_rates.setter
     def site_rates(self, value):
@@ -3804,32 +4247,18 @@ def merge_alleles(
 
         ValueError: If the line has a non-even number of alleles.
     """
-    ret = list()
     if second is not None:
         if len(first) != len(second):
             raise ValueError(
                 "First and second lines have different number of alleles\n"
             )
-        else:
-            for i in range(0, len(first)):
-                ret.append(str(first[i]) + "/" + str(second[i]))
+        first = np.asarray(first, dtype=str)
+        second = np.asarray(second, dtype=str)
     else:
         if len(first) % 2 != 0:
             raise ValueError("Line has non-even number of alleles!\n")
-        else:
-            for i, j in zip(first[::2], first[1::2]):
-                ret.append(str(i) + "/" + str(j))
-    return ret
-
-    def __reduce__(self):
-        reconstruct_args = (self.filename, self.filetype, self.popmapfile, self.force_popmap,
-                            self.exclude_pops, self.include_pops, self.guidetree,
-                            self.qmatrix_iqtree, self.qmatrix, self.siterates,
-                            self.siterates_iqtree, self.plot_format, self.prefix,
-                            self.chunk_size, self.verbose)
-
-        # Excluding vcf_header from state dictionary
-        state = {k: v for k, v in self.__dict__.items() if k not in ['vcf_header']}
-
-        callable = self.__class__
-        return (callable, reconstruct_args, state)
+        first, second = (
+            np.asarray(first[::2], dtype=str),
+            np.asarray(first[1::2], dtype=str),
+        )
+    return np.char.add(np.char.add(first, "/"), second).tolist()
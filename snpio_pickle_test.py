@@ -1,5 +1,6 @@
 import pickle
 import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from snpio import GenotypeData, NRemover2, Plotting
 
 
@@ -24,14 +25,26 @@ def main():
     parallel_processing_test(gd)
 
 
-def process_data(gd):
+_worker_gd = None
+
+
+def init_worker(gd):
+    # Runs once per worker, so gd is transferred once per process
+    # rather than once per task.
+    global _worker_gd
+    _worker_gd = gd
+
+
+def process_data(_):
     print(f"Processing data in process with id: {multiprocessing.current_process().pid}")
-    return gd.num_snps
+    return _worker_gd.num_snps
 
 
 def parallel_processing_test(gd):
-    with multiprocessing.Pool(2) as pool:
-        results = pool.map(process_data, [gd, gd])
+    with ProcessPoolExecutor(
+        max_workers=2, initializer=init_worker, initargs=(gd,)
+    ) as executor:
+        results = list(executor.map(process_data, range(2)))
     print("Results:", results)
 
 